@@ -1,225 +1,152 @@
+import time
+STARTUP_START = time.perf_counter()
+
 import pygame
-import random
 import numpy as np
-from tensorflow.keras.models import load_model
-from tensorflow.keras.losses import MeanSquaredError
 import threading
-import time
-
-pygame.init()
-
-SCREEN_WIDTH = 800
-SCREEN_HEIGHT = 400
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("Pula ou morre")
-
-font = pygame.font.Font(None, 36)
-
-class Player:
-    def __init__(self):
-        self.width = 50
-        self.height = 50
-        self.x = 100
-        self.y = SCREEN_HEIGHT - self.height - 10
-        self.velocity = 10
-        self.is_jumping = False
-        self.jump_height = 150
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
-        self.on_ground = True 
-
-    def jump(self):
-        if self.on_ground:
-            self.is_jumping = True
-            self.jump_peak = self.y - self.jump_height
-            self.on_ground = False
-
-    def update(self):
-        if self.is_jumping:
-            if self.y > self.jump_peak:
-                self.y -= self.velocity
-            else:
-                self.is_jumping = False
-        elif self.y < SCREEN_HEIGHT - self.height - 10:
-            self.y += self.velocity
-        else:
-            self.on_ground = True
-            self.y = SCREEN_HEIGHT - self.height - 10
-
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
-
-    def draw(self):
-        pygame.draw.rect(screen, (0, 255, 0), self.rect)
-
-
-class Obstacle:
-    def __init__(self):
-        self.width = 50
-        self.height = 50
-        self.x = SCREEN_WIDTH
-        self.y = SCREEN_HEIGHT - self.height - 10
-        self.velocity = random.randint(6, 12)
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
-        self.passed_player = False
-
-    def update(self):
-        self.x -= self.velocity
-        if self.x < -self.width:
-            self.reset()
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
-
-    def reset(self):
-        self.x = SCREEN_WIDTH
-        self.velocity = random.randint(6, 12)
-        self.passed_player = False
-
-    def draw(self):
-        pygame.draw.rect(screen, (255, 0, 0), self.rect)
-        
-class Coin:
-    def __init__(self):
-        self.width = 20
-        self.height = 20
-        self.x = SCREEN_WIDTH
-        self.y = SCREEN_HEIGHT - self.height - 100
-        self.velocity = random.randint(16, 25)
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
-        self.passed_player = False
-
-    def update(self):
-        self.x -= self.velocity
-        if self.x <= 0:
-            self.reset()
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
-
-    def reset(self):
-        self.x = SCREEN_WIDTH
-        self.velocity = random.randint(16, 25)
-        self.passed_player = False
-
-    def draw(self):
-        pygame.draw.rect(screen, (255, 255, 0), self.rect)
+from jump_env import JumpEnv, SCREEN_WIDTH, SCREEN_HEIGHT
+from policy import load_policy
+from profiler import StartupReport, frame_profiler_from_env
+from recorder import EpisodeRecorder
+from renderer import DirtyRenderer
 
 
 class Game:
-    def __init__(self, model_path):
-        self.obstacle = Obstacle()
-        self.player = Player()
-        self.coin = Coin()
-        self.score = 0
-        self.coins = 0
-        self.errors = 0
-        self.done = False
-        self.penalty_collision = -5
-        self.model = load_model(model_path, custom_objects={'mse': MeanSquaredError()})
+    def __init__(self, model_path, inference_mode="sync", backend="numpy", action_repeat=1, seed=None, record_dir=None):
+        self.startup = StartupReport(STARTUP_START)
+        self.startup.mark("imports")
+        pygame.init()
+        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pygame.display.set_caption("Pula ou morre")
+        self.font = pygame.font.Font(None, 36)
+        # Textos em cache e só os retângulos que mudaram vão para a tela
+        self.renderer = DirtyRenderer(self.screen, self.font)
+        self.clock = pygame.time.Clock()
+        # GAME_PROFILE=1 (ou um caminho .json / .trace.json) mede cada fase do frame
+        self.profiler = frame_profiler_from_env()
+        self.startup.mark("janela")
+        # Com seed as velocidades de obstáculo e moeda se repetem bit a bit entre execuções
+        self.env = JumpEnv(with_coins=True, seed=seed)
+        self.model_path = model_path
+        # "sync": um forward compilado por frame de decisão, na própria thread do jogo
+        # "thread": loop antigo de model.predict rodando em paralelo
+        # backend "numpy" roda os pesos do .h5 em NumPy; "keras" usa o modelo compilado no TF
+        self.inference_mode = inference_mode
         self.action = 0
-        self.lock = threading.Lock()
-        self.model_thread = threading.Thread(target=self.predict_action_loop, daemon=True)
-        self.model_thread.start()
-        self.interval_to_action = 1
+        if inference_mode == "thread":
+            # TensorFlow só entra quando o backend Keras antigo é pedido
+            from tensorflow.keras.models import load_model
+            from tensorflow.keras.losses import MeanSquaredError
+
+            self.model = load_model(model_path, custom_objects={'mse': MeanSquaredError()})
+            self.lock = threading.Lock()
+            self.decision_requested = threading.Event()
+            # Quantas ações o modelo já produziu (até a primeira, o jogo usa self.action = 0)
+            self.predictions = 0
+            self.model_thread = threading.Thread(target=self.predict_action_loop, daemon=True)
+            self.model_thread.start()
+        else:
+            self.policy = load_policy(model_path, backend)
+        self.startup.mark("carregar modelo")
+        # Decide a cada action_repeat frames e repete a mesma ação nos frames do meio
+        self.interval_to_action = action_repeat
         self.current_frame = 0
+        # Com record_dir cada frame (estado, ação, recompensa, done, Q) vai para blocos .npy
+        self.recorder = None
+        if record_dir is not None:
+            state_size = len(self.env.get_state()[0])
+            self.recorder = EpisodeRecorder(record_dir, state_size, 2, metadata={
+                "model": model_path.split('/')[-1], "seed": seed, "action_repeat": action_repeat})
         self.fps = 25
-        self.cpu_sleep = 0
 
     def show_text(self, text, x, y, color=(255, 255, 255)):
-        render = font.render(text, True, color)
-        screen.blit(render, (x, y))
-
-    def reset(self):
-        self.score = 0
-        self.errors = 0
-        self.player.y = SCREEN_HEIGHT - self.player.height - 10
-        self.obstacle.reset()
-        
-    def check_collision(self):
-        player_final = self.player.x + self.player.width
-        obstacle_final = self.obstacle.x + self.obstacle.width
-
-        if obstacle_final < self.player.x:
-            return 0.5
-
-        if (self.player.y < self.obstacle.y + self.obstacle.height and
-            self.player.y + self.player.height > self.obstacle.y and
-            player_final > self.obstacle.x and
-            self.player.x < obstacle_final):
-                self.errors += 1 
-                self.obstacle.reset()
-                return self.penalty_collision
-        return 0
-    
-    def check_capture_coin(self):
-        if self.player.rect.colliderect(self.coin.rect) and not self.coin.passed_player:
-            self.coins += 1
-            self.coin.reset()
-            return 20
-        return 0
-
-    def check_pass(self):
-        if (self.obstacle.x + self.obstacle.width) < self.player.x:
-            self.score += 1
-            self.obstacle.passed_player = True
-            self.obstacle.reset()
-            return 20
-        return 0
+        # Cada linha do placar é identificada pela posição
+        self.renderer.text((x, y), text, (x, y), color)
+
+    def draw_entity(self, entity, color):
+        self.renderer.rect(entity, (entity.x, entity.y, entity.width, entity.height), color)
 
     def get_state(self):
-        return np.array([
-            (self.player.x - self.obstacle.x) / SCREEN_WIDTH,
-            self.obstacle.velocity / 12,
-            (self.player.y - self.obstacle.y) / SCREEN_HEIGHT,
-            (self.player.x - self.coin.x) / SCREEN_WIDTH,
-            self.coin.velocity / 25,
-            int(self.player.on_ground),
-        ]).reshape(1, 6)
+        return self.env.get_state()
 
     def predict_action_loop(self):
+        # Só roda o modelo quando o jogo pede uma decisão nova
         while True:
+            self.decision_requested.wait()
+            self.decision_requested.clear()
             state = self.get_state()
             action = self.model.predict(state)
             with self.lock:
-                self.action = np.argmax(action[0]) 
-            time.sleep(self.cpu_sleep) 
+                self.action = np.argmax(action[0])
+                self.predictions += 1
 
     def run(self):
         running = True
+        action = 0
+        q_values = None
+        inferred = False
         while running:
-            action = 0
+            self.profiler.begin_frame()
             self.current_frame += 1
-            screen.fill((0, 0, 0))
+            self.renderer.begin()
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
-
-            if self.current_frame % self.interval_to_action == 0:
-                self.current_frame = 0
-                with self.lock:
-                    action = self.action
-
-            if action == 1 and not self.player.is_jumping:
-                self.player.jump()
-
-            self.check_capture_coin()
-            self.check_collision()
-            self.check_pass()
-            
-            self.player.update()
-            self.obstacle.update()
-            self.coin.update()
-
-            self.player.draw()
-            self.obstacle.draw()
-            self.coin.draw()
+            self.profiler.lap("eventos")
+
+            # Decide no primeiro frame e depois a cada interval_to_action frames
+            if (self.current_frame - 1) % self.interval_to_action == 0:
+                if self.inference_mode == "thread":
+                    with self.lock:
+                        action = self.action
+                        inferred = self.predictions > 0
+                    self.decision_requested.set()
+                else:
+                    action = self.policy.act(self.env.get_state())
+                    q_values = self.policy.last_q_values
+                    inferred = True
+                # No modo thread a primeira inferência é o primeiro frame que usa uma ação do modelo
+                if inferred and not self.startup.printed:
+                    self.startup.mark("primeira inferência")
+            self.profiler.lap("inferência")
+
+            if self.recorder is not None:
+                state = self.env.get_state()
+            _, reward, done, _ = self.env.step(action)
+            self.profiler.lap("física e colisões")
+            if self.recorder is not None:
+                self.recorder.record(state, action, reward, done, q_values)
+                self.profiler.lap("gravação")
+            score, errors, coins = self.env.score, self.env.errors, self.env.coins
+
+            self.draw_entity(self.env.player, (0, 255, 0))
+            self.draw_entity(self.env.obstacle, (255, 0, 0))
+            self.draw_entity(self.env.coin, (255, 255, 0))
             
-            if self.score:
-                self.show_text(f"Acertos: {self.score} | ({(100 - ((self.errors * 100) / (self.score + self.errors))):.2f}%)", 10, 10)
-                self.show_text(f"Erros: {self.errors} | ({((self.errors * 100) / (self.score + self.errors)):.2f}%)", 10, 50, color=(255, 0, 0))
-            if self.coins:
-                self.show_text(f"Moedas: {self.coins}", 10, 30, color=(255, 255, 0))
-            self.show_text(f"Model: {model_path.split('/')[-1]}", 10, 75, color=(120, 120, 220))
-
-
-            pygame.display.flip()
-            pygame.time.Clock().tick(self.fps)
-
+            if score:
+                self.show_text(f"Acertos: {score} | ({(100 - ((errors * 100) / (score + errors))):.2f}%)", 10, 10)
+                self.show_text(f"Erros: {errors} | ({((errors * 100) / (score + errors)):.2f}%)", 10, 50, color=(255, 0, 0))
+            if coins:
+                self.show_text(f"Moedas: {coins}", 10, 30, color=(255, 255, 0))
+            self.show_text(f"Model: {self.model_path.split('/')[-1]}", 10, 75, color=(120, 120, 220))
+
+
+            self.profiler.lap("desenho")
+            self.renderer.present()
+            self.profiler.lap("apresentar")
+            if inferred and not self.startup.printed:
+                self.startup.mark("primeiro frame")
+                self.startup.report_once()
+            self.clock.tick(self.fps)
+            self.profiler.lap("relógio")
+            self.profiler.end_frame()
+
+        self.profiler.close()
+        if self.inference_mode != "thread":
+            print(f"Latência por decisão: {self.policy.latency.summary()}")
+        if self.recorder is not None:
+            self.recorder.close()
+            print(f"Gravação: {sum(self.recorder.chunks)} frames em {self.recorder.directory}")
         pygame.quit()
 
 
@@ -11,6 +11,8 @@ pygame.display.set_caption("Pula ou morre")
 font = pygame.font.Font(None, 36)
 
 class Player:
+    __slots__ = ("width", "height", "x", "y", "velocity", "is_jumping", "jump_height", "on_ground", "jump_peak")
+
     def __init__(self):
         self.width = 50
         self.height = 50
@@ -19,7 +21,6 @@ class Player:
         self.velocity = 10
         self.is_jumping = False
         self.jump_height = 150
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
         self.on_ground = True 
 
     def jump(self):
@@ -40,27 +41,25 @@ class Player:
             self.on_ground = True
             self.y = SCREEN_HEIGHT - self.height - 10
 
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
-
     def draw(self):
-        pygame.draw.rect(screen, (0, 255, 0), self.rect)
+        pygame.draw.rect(screen, (0, 255, 0), (self.x, self.y, self.width, self.height))
 
 
 class Obstacle:
+    __slots__ = ("width", "height", "x", "y", "velocity", "passed_player")
+
     def __init__(self):
         self.width = 50
         self.height = 50
         self.x = SCREEN_WIDTH
         self.y = SCREEN_HEIGHT - self.height - 10
         self.velocity = random.randint(6, 10)
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
         self.passed_player = False
 
     def update(self):
         self.x -= self.velocity
         if self.x < -self.width:
             self.reset()
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
 
     def reset(self):
         self.x = SCREEN_WIDTH
@@ -68,24 +67,24 @@ class Obstacle:
         self.passed_player = False
 
     def draw(self):
-        pygame.draw.rect(screen, (255, 0, 0), self.rect)
+        pygame.draw.rect(screen, (255, 0, 0), (self.x, self.y, self.width, self.height))
         
         
 class Coin:
+    __slots__ = ("width", "height", "x", "y", "velocity", "passed_player")
+
     def __init__(self):
         self.width = 20
         self.height = 20
         self.x = SCREEN_WIDTH
         self.y = SCREEN_HEIGHT - self.height - 100
         self.velocity = random.randint(9, 25)
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
         self.passed_player = False
 
     def update(self):
         self.x -= self.velocity
         if self.x <= 0:
             self.reset()
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
 
     def reset(self):
         self.x = SCREEN_WIDTH
@@ -93,7 +92,7 @@ class Coin:
         self.passed_player = False
 
     def draw(self):
-        pygame.draw.rect(screen, (255, 255, 0), self.rect)
+        pygame.draw.rect(screen, (255, 255, 0), (self.x, self.y, self.width, self.height))
 
 
 class Game:
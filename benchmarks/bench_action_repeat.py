@@ -0,0 +1,56 @@
+"""Decisões/s vs. frames/s com action_repeat.
+
+Cada decisão custa um forward do modelo; com action_repeat=k a física roda k
+frames por decisão. Foguete: DQNAgent.act (Keras, o que o trainer usa).
+Pula ou morre: NumpyPolicy de um modelo do models-ok, como no app.py.
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "rocket-game", "stage-1"))
+
+from jump_env import JumpEnv
+from policy import load_policy
+from rocket_env import RocketEnv
+
+
+def bench(env, act, decisions):
+    state = env.reset()
+    frames = 0
+    start = time.perf_counter()
+    for _ in range(decisions):
+        state, _, done, info = env.step(act(state))
+        frames += info.get("frames", env.action_repeat)
+        if done and isinstance(env, RocketEnv):
+            state = env.reset()
+    elapsed = time.perf_counter() - start
+    return decisions / elapsed, frames / elapsed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeats", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--decisions", type=int, default=500)
+    parser.add_argument("--model", default=sorted(glob.glob(os.path.join(ROOT, "models-ok", "*.h5")))[0])
+    args = parser.parse_args()
+
+    from dqn_agent import DQNAgent
+
+    agent = DQNAgent()
+    agent.epsilon = 0.0
+    policy = load_policy(args.model, "numpy")
+    with_coins = policy.state_size == 6
+
+    for k in args.repeats:
+        cases = [
+            ("foguete (Keras act)", RocketEnv(action_repeat=k), agent.act, args.decisions),
+            ("pula ou morre (NumPy)", JumpEnv(with_coins=with_coins, action_repeat=k), policy.act, 50 * args.decisions),
+        ]
+        for name, env, act, decisions in cases:
+            decisions_per_sec, frames_per_sec = bench(env, act, decisions)
+            print(f"k={k}  {name:22s} {decisions_per_sec:10.0f} decisões/s  {frames_per_sec:10.0f} frames/s")
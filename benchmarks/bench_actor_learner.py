@@ -0,0 +1,26 @@
+"""Transições/s do actor/learner em função do número de actors."""
+import argparse
+import multiprocessing
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "rocket-game", "stage-1"))
+
+from actor_learner import ActorLearner
+
+
+if __name__ == "__main__":
+    from dqn_agent import DQNAgent
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--actors", type=int, nargs="+",
+                        default=sorted({1, 2, 4, multiprocessing.cpu_count()}))
+    parser.add_argument("--transitions", type=int, default=50_000)
+    parser.add_argument("--updates-per-chunk", type=int, default=1)
+    args = parser.parse_args()
+
+    for num_actors in args.actors:
+        agent = DQNAgent(memory_size=args.transitions)
+        stats = ActorLearner(agent, num_actors, updates_per_chunk=args.updates_per_chunk).run(args.transitions)
+        print(f"actors={num_actors:3d}  {stats['transitions_per_sec']:10.0f} transições/s  ({stats['updates']} updates)")
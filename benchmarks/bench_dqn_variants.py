@@ -0,0 +1,71 @@
+"""Curvas de retorno por episódio do DQN com e sem target network / Double DQN.
+
+Treina cada variante do DQNAgent no VectorRocketEnv (mesma seed) com episódios
+de horizonte fixo e grava a curva de retorno médio por episódio em JSON.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "rocket-game", "stage-1"))
+
+from dqn_agent import DQNAgent
+from rocket_env import VectorRocketEnv
+
+VARIANTS = {
+    "sem target": {},
+    "target hard/100": {"target_sync_every": 100},
+    "target polyak": {"tau": 0.01},
+    "double dqn": {"target_sync_every": 100, "double_dqn": True},
+}
+
+
+def train(agent_kwargs, episodes, horizon, lanes, replay_every, seed):
+    # Exploração e amostragem da memória vêm dos Generators do agente; set_random_seed só fixa
+    # a inicialização dos pesos (o gerador do Keras 3 não volta ao início com tf.random.set_seed)
+    import tensorflow as tf
+    tf.keras.utils.set_random_seed(seed)
+
+    agent = DQNAgent(epsilon_decay=0.995, memory_size=100_000, seed=seed, **agent_kwargs)
+    env = VectorRocketEnv(lanes, seed=seed)
+    returns, replays = [], 0
+    start = time.perf_counter()
+    for _ in range(episodes):
+        states = env.reset()
+        episode_return = np.zeros(lanes)
+        for step in range(horizon):
+            actions = agent.act_batch(states)
+            next_states, rewards, dones = env.step(actions)
+            agent.memory.extend(states, actions, rewards, next_states, dones)
+            episode_return += rewards
+            states = env.get_state()
+            if step % replay_every == 0:
+                agent.replay(32)
+                replays += 1
+        returns.append(float(episode_return.mean()))
+    return returns, replays, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--episodes", type=int, default=20)
+    parser.add_argument("--horizon", type=int, default=300)
+    parser.add_argument("--lanes", type=int, default=16)
+    parser.add_argument("--replay-every", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="dqn_variants.json")
+    args = parser.parse_args()
+
+    curves = {}
+    for name, agent_kwargs in VARIANTS.items():
+        returns, replays, seconds = train(agent_kwargs, args.episodes, args.horizon, args.lanes, args.replay_every, args.seed)
+        curves[name] = returns
+        last = np.mean(returns[-max(1, len(returns) // 4):])
+        print(f"{name:16s} retorno médio (último quarto) {last:9.1f}  {replays} replays em {seconds:.1f}s")
+    with open(args.output, "w") as f:
+        json.dump(curves, f, indent=2)
@@ -0,0 +1,180 @@
+"""Entidades com __slots__ e sem Rect por frame vs. as classes antigas.
+
+As classes Legacy* reproduzem o jeito antigo (atributos em __dict__ e um
+pygame.Rect novo a cada update, colisão com colliderect). Mede tempo por
+frame em 1e6 frames, memória por instância, pico do tracemalloc e quantos
+Rects são criados por frame. Também roda Rocket.update do rocket_env.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "rocket-game", "stage-1"))
+
+import pygame
+
+from jump_env import GROUND_Y, SCREEN_WIDTH, Coin, Obstacle, Player, collides
+from rocket_env import Rocket, Target
+
+RECTS_CREATED = [0]
+
+
+def make_rect(x, y, width, height):
+    RECTS_CREATED[0] += 1
+    return pygame.Rect(x, y, width, height)
+
+
+class LegacyPlayer:
+    def __init__(self, rect=pygame.Rect):
+        self.make_rect = rect
+        self.width = 50
+        self.height = 50
+        self.x = 100
+        self.y = GROUND_Y
+        self.velocity = 10
+        self.is_jumping = False
+        self.jump_height = 150
+        self.rect = self.make_rect(self.x, self.y, self.width, self.height)
+        self.on_ground = True
+
+    def jump(self):
+        if self.on_ground:
+            self.is_jumping = True
+            self.jump_peak = self.y - self.jump_height
+            self.on_ground = False
+
+    def update(self):
+        if self.is_jumping:
+            if self.y > self.jump_peak:
+                self.y -= self.velocity
+            else:
+                self.is_jumping = False
+        elif self.y < GROUND_Y:
+            self.y += self.velocity
+        else:
+            self.on_ground = True
+            self.y = GROUND_Y
+        self.rect = self.make_rect(self.x, self.y, self.width, self.height)
+
+
+class LegacyMover:
+    def __init__(self, width, y, velocity_range, min_x, rect=pygame.Rect):
+        self.make_rect = rect
+        self.min_x = min_x
+        self.width = width
+        self.height = width
+        self.x = SCREEN_WIDTH
+        self.y = y
+        self.velocity_range = velocity_range
+        self.velocity = random.randint(*velocity_range)
+        self.rect = self.make_rect(self.x, self.y, self.width, self.height)
+        self.passed_player = False
+
+    def update(self):
+        self.x -= self.velocity
+        if self.x < self.min_x:
+            self.reset()
+        self.rect = self.make_rect(self.x, self.y, self.width, self.height)
+
+    def reset(self):
+        self.x = SCREEN_WIDTH
+        self.velocity = random.randint(*self.velocity_range)
+        self.passed_player = False
+
+
+def legacy_entities(rect=pygame.Rect):
+    # Obstáculo volta quando x < -largura, moeda quando x <= 0 (x < 1), como em jump_env
+    return LegacyPlayer(rect), LegacyMover(50, 340, (6, 12), -50, rect), LegacyMover(20, 280, (9, 25), 1, rect)
+
+
+def slots_entities():
+    return Player(), Obstacle(), Coin()
+
+
+def run_legacy(entities, frames):
+    player, obstacle, coin = entities
+    hits = 0
+    for frame in range(frames):
+        if frame % 40 == 0:
+            player.jump()
+        player.update()
+        obstacle.update()
+        coin.update()
+        hits += player.rect.colliderect(obstacle.rect) + player.rect.colliderect(coin.rect)
+    return hits
+
+
+def run_slots(entities, frames):
+    player, obstacle, coin = entities
+    hits = 0
+    for frame in range(frames):
+        if frame % 40 == 0:
+            player.jump()
+        player.update()
+        obstacle.update()
+        coin.update()
+        hits += collides(player, obstacle) + collides(player, coin)
+    return hits
+
+
+def instance_bytes(entities):
+    total = 0
+    for entity in entities:
+        total += sys.getsizeof(entity)
+        if hasattr(entity, "__dict__"):
+            total += sys.getsizeof(entity.__dict__)
+        if hasattr(entity, "rect"):
+            total += sys.getsizeof(entity.rect)
+    return total
+
+
+def measure(run, make_entities, frames):
+    random.seed(0)
+    entities = make_entities()
+    start = time.perf_counter()
+    hits = run(entities, frames)
+    elapsed = time.perf_counter() - start
+
+    random.seed(0)
+    entities = make_entities()
+    tracemalloc.start()
+    run(entities, min(frames, 100_000))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed / frames, hits, peak, instance_bytes(entities)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--frames", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    RECTS_CREATED[0] = 0
+    run_legacy(legacy_entities(make_rect), 1000)
+    legacy_rects = (RECTS_CREATED[0] - 3) / 1000
+
+    results = [
+        ("antigo (__dict__ + Rect)", measure(run_legacy, legacy_entities, args.frames), legacy_rects),
+        ("__slots__ sem Rect", measure(run_slots, slots_entities, args.frames), 0.0),
+    ]
+    for name, (per_frame, hits, peak, size), rects in results:
+        print(f"{name:25s} {per_frame * 1e9:6.0f} ns/frame  {rects:.0f} Rects/frame  "
+              f"{size:5d} bytes nas 3 entidades  pico tracemalloc {peak / 1024:6.1f} KiB  colisões {hits}")
+    assert results[0][1][1] == results[1][1][1], "as duas versões deveriam colidir nos mesmos frames"
+
+    rocket = Rocket(475, 703, 30, 47)
+    target = Target(100, 100, 10, 10)
+    start = time.perf_counter()
+    for frame in range(args.frames):
+        if frame % 50 == 0:
+            rocket.handle_input(frame // 50 % 3)
+        rocket.update(1000, 750)
+        target.calculate_distance_to_rocket(rocket.rocket_rect)
+    per_frame = (time.perf_counter() - start) / args.frames
+    print(f"Rocket.update + distância {per_frame * 1e9:6.0f} ns/frame  "
+          f"{sys.getsizeof(rocket) + sys.getsizeof(target)} bytes (Rocket + Target, sem __dict__)")
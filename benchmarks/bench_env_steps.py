@@ -0,0 +1,37 @@
+"""Passos/s crus dos ambientes headless (JumpEnv e RocketEnv), sem tela nem relógio."""
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "rocket-game", "stage-1"))
+
+from jump_env import JumpEnv
+from rocket_env import RocketEnv
+
+
+def bench(env, actions, steps):
+    env.reset()
+    choices = [random.choice(actions) for _ in range(steps)]
+    start = time.perf_counter()
+    for action in choices:
+        env.step(action)
+    return steps / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--steps", type=int, default=100_000)
+    args = parser.parse_args()
+
+    cases = [
+        ("JumpEnv", JumpEnv(), (0, 1)),
+        ("JumpEnv with_coins", JumpEnv(with_coins=True), (0, 1)),
+        ("RocketEnv", RocketEnv(shaped_reward=False, normalize_state=False), (0, 1, 2)),
+        ("RocketEnv shaped", RocketEnv(), (0, 1, 2)),
+    ]
+    for name, env, actions in cases:
+        print(f"{name:20s} {bench(env, actions, args.steps):12.0f} passos/s")
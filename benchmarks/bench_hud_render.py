@@ -0,0 +1,104 @@
+"""Custo por frame do desenho do pula ou morre: flip da tela inteira vs. DirtyRenderer.
+
+Grava uma partida (com moedas, jogada por um modelo) e desenha os mesmos
+frames dos dois jeitos, sem limite de FPS: o antigo (fill + font.render do
+placar + display.flip) e o DirtyRenderer (textos em cache +
+display.update só nos retângulos sujos). Confere que a tela fica igual.
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+import pygame
+
+from jump_env import SCREEN_HEIGHT, SCREEN_WIDTH, JumpEnv
+from policy import load_policy
+from renderer import DirtyRenderer
+
+ENTITY_COLORS = ((0, 255, 0), (255, 0, 0), (255, 255, 0))
+
+
+def record_game(model_path, frames, seed):
+    policy = load_policy(model_path)
+    env = JumpEnv(with_coins=policy.state_size == 6, seed=seed)
+    state = env.get_state()
+    recorded = []
+    for _ in range(frames):
+        state, _, _, _ = env.step(policy.act(state))
+        entities = [(entity.x, entity.y, entity.width, entity.height) for entity in (env.player, env.obstacle, env.coin)]
+        recorded.append((entities, env.score, env.errors, env.coins))
+    return recorded
+
+
+def hud_lines(score, errors, coins, model_name):
+    lines = []
+    if score:
+        lines.append((f"Acertos: {score} | ({(100 - ((errors * 100) / (score + errors))):.2f}%)", (10, 10), (255, 255, 255)))
+        lines.append((f"Erros: {errors} | ({((errors * 100) / (score + errors)):.2f}%)", (10, 50), (255, 0, 0)))
+    if coins:
+        lines.append((f"Moedas: {coins}", (10, 30), (255, 255, 0)))
+    lines.append((f"Model: {model_name}", (10, 75), (120, 120, 220)))
+    return lines
+
+
+def draw_full(screen, font, recorded, model_name, snapshot_every):
+    snapshots = []
+    start = time.perf_counter()
+    for frame, (entities, score, errors, coins) in enumerate(recorded):
+        screen.fill((0, 0, 0))
+        for rect, color in zip(entities, ENTITY_COLORS):
+            pygame.draw.rect(screen, color, rect)
+        for text, position, color in hud_lines(score, errors, coins, model_name):
+            screen.blit(font.render(text, True, color), position)
+        pygame.display.flip()
+        if frame % snapshot_every == 0:
+            snapshots.append(pygame.image.tobytes(screen, "RGB"))
+    return (time.perf_counter() - start) / len(recorded), snapshots
+
+
+def draw_dirty(screen, font, recorded, model_name, snapshot_every):
+    renderer = DirtyRenderer(screen, font)
+    snapshots = []
+    updated_area = 0
+    start = time.perf_counter()
+    for frame, (entities, score, errors, coins) in enumerate(recorded):
+        renderer.begin()
+        for index, (rect, color) in enumerate(zip(entities, ENTITY_COLORS)):
+            renderer.rect(index, rect, color)
+        for text, position, color in hud_lines(score, errors, coins, model_name):
+            renderer.text(position, text, position, color)
+        updated_area += sum(rect.width * rect.height for rect in renderer.present())
+        if frame % snapshot_every == 0:
+            snapshots.append(pygame.image.tobytes(screen, "RGB"))
+    elapsed = time.perf_counter() - start
+    return elapsed / len(recorded), snapshots, updated_area / len(recorded) / (SCREEN_WIDTH * SCREEN_HEIGHT)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--model", default=os.path.join(ROOT, "models-ok", "model-gm--0.7-mem--2000-relu32-relu64.h5"))
+    parser.add_argument("--frames", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--snapshot-every", type=int, default=97)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    font = pygame.font.Font(None, 36)
+    model_name = os.path.basename(args.model)
+    recorded = record_game(args.model, args.frames, args.seed)
+
+    full_s, full_snapshots = draw_full(screen, font, recorded, model_name, args.snapshot_every)
+    dirty_s, dirty_snapshots, area = draw_dirty(screen, font, recorded, model_name, args.snapshot_every)
+    assert full_snapshots == dirty_snapshots, "DirtyRenderer deixou a tela diferente do desenho completo"
+    print(f"tela cheia     {full_s * 1e6:7.1f} us/frame  {1 / full_s:8.0f} FPS")
+    print(f"DirtyRenderer  {dirty_s * 1e6:7.1f} us/frame  {1 / dirty_s:8.0f} FPS  ({full_s / dirty_s:.1f}x, "
+          f"{area:.1%} da tela atualizada por frame)")
+    print(f"Telas iguais em {len(full_snapshots)} frames comparados")
+    pygame.quit()
@@ -0,0 +1,44 @@
+"""Paridade NumPy x Keras nos .h5 do repo e latência por decisão de cada forma de inferência."""
+import argparse
+import glob
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from policy import KerasPolicy, LatencyTracker, NumpyPolicy, check_numpy_parity
+
+
+def bench(act, states):
+    tracker = LatencyTracker()
+    act(states[0])  # aquecimento
+    for state in states:
+        start = time.perf_counter()
+        act(state)
+        tracker.add(time.perf_counter() - start)
+    return tracker.summary()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--model", default=os.path.join(ROOT, "models-ok", "model-gm--0.7-mem--2000-relu32-relu64.h5"))
+    parser.add_argument("--decisions", type=int, default=500)
+    args = parser.parse_args()
+
+    model_paths = sorted(glob.glob(os.path.join(ROOT, "*.h5")) + glob.glob(os.path.join(ROOT, "models-ok", "*.h5"))
+                         + glob.glob(os.path.join(ROOT, "rocket-game", "stage-1", "*.h5")))
+    print(f"paridade NumPy x Keras ok em {check_numpy_parity(model_paths)} modelos")
+
+    compiled = KerasPolicy(args.model)
+    direct = KerasPolicy(args.model, compiled=False)
+    model = compiled.model
+    states = np.random.default_rng(0).random((args.decisions, 1, compiled.state_size)).astype(np.float32)
+
+    print(f"model.predict:   {bench(lambda s: np.argmax(model.predict(s, verbose=0)[0]), states[:100])}")
+    print(f"model(x):        {bench(direct.act, states)}")
+    print(f"tf.function:     {bench(compiled.act, states)}")
+    print(f"NumPy:           {bench(NumpyPolicy(args.model).act, states)}")
@@ -0,0 +1,61 @@
+"""Passos/s do JumpEnvBatch e taxa de acerto dos modelos .h5 avaliados em lote.
+
+Antes, confere que cada linha do lote sorteia as mesmas velocidades de
+obstáculo e moeda que um JumpEnv com a seed filha correspondente.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from jump_env import JumpEnvBatch
+from jump_parity import check_parity
+
+
+def bench_steps(n, steps, with_coins):
+    env = JumpEnvBatch(n, with_coins=with_coins, seed=0)
+    actions = np.random.default_rng(0).integers(0, 2, size=(steps, n))
+    start = time.perf_counter()
+    for step in range(steps):
+        env.step(actions[step])
+    return n * steps / (time.perf_counter() - start)
+
+
+def evaluate_model(model_path, n, steps):
+    from tensorflow.keras.models import load_model
+    from tensorflow.keras.losses import MeanSquaredError
+
+    model = load_model(model_path, custom_objects={'mse': MeanSquaredError()})
+    env = JumpEnvBatch(n, with_coins=model.input_shape[-1] == 6, seed=0)
+    state = env.get_state()
+    for _ in range(steps):
+        actions = np.argmax(np.asarray(model(state, training=False)), axis=1)
+        state, _, _ = env.step(actions)
+    hits = env.score.sum() / max(1, env.score.sum() + env.errors.sum())
+    return hits, env.coins.mean()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 64, 1024, 4096])
+    parser.add_argument("--steps", type=int, default=1000)
+    parser.add_argument("--models", nargs="*", default=[
+        os.path.join(ROOT, "model.h5"),
+        os.path.join(ROOT, "models-ok", "model-gm--0.7-mem--2000-relu32-relu64.h5"),
+    ])
+    args = parser.parse_args()
+
+    for with_coins in (False, True):
+        print(f"with_coins={with_coins!s:5s} paridade JumpEnv x JumpEnvBatch ok ({check_parity(with_coins=with_coins)} passos)")
+        for n in args.sizes:
+            rate = bench_steps(n, args.steps, with_coins)
+            print(f"with_coins={with_coins!s:5s} N={n:5d}  {rate:12.0f} passos/s")
+
+    for model_path in args.models:
+        hits, coins = evaluate_model(model_path, 1024, args.steps)
+        print(f"{os.path.basename(model_path)}: acertos {hits * 100:.2f}%  moedas/jogo {coins:.1f}")
@@ -0,0 +1,62 @@
+"""Custo de sample/update do PrioritizedReplayBuffer (sum-tree) de 1e4 a 1e6 de capacidade."""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "rocket-game", "stage-1"))
+
+from replay_memory import PrioritizedReplayBuffer, ReplayBuffer
+
+STATE_SIZE = 7
+
+
+def fill(memory, chunk=10_000):
+    rng = np.random.default_rng(0)
+    for start in range(0, memory.capacity, chunk):
+        count = min(chunk, memory.capacity - start)
+        states = rng.random((count, STATE_SIZE), dtype=np.float32)
+        memory.extend(states, np.zeros(count, dtype=np.int64), np.zeros(count), states, np.zeros(count))
+
+
+def bench(capacity, batch_size, calls):
+    memory = PrioritizedReplayBuffer(capacity, STATE_SIZE)
+    start = time.perf_counter()
+    fill(memory)
+    fill_time = time.perf_counter() - start
+
+    td_errors = np.random.default_rng(0).normal(size=(calls, batch_size))
+    sample_time = update_time = 0.0
+    for call in range(calls):
+        start = time.perf_counter()
+        indices, _ = memory.sample_prioritized(batch_size)
+        memory.get(indices)
+        sample_time += time.perf_counter() - start
+        start = time.perf_counter()
+        memory.update_priorities(indices, td_errors[call])
+        update_time += time.perf_counter() - start
+
+    uniform = ReplayBuffer(capacity, STATE_SIZE)
+    fill(uniform)
+    start = time.perf_counter()
+    for _ in range(calls):
+        uniform.sample(batch_size)
+    uniform_time = time.perf_counter() - start
+    return fill_time / capacity, sample_time / calls, update_time / calls, uniform_time / calls
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--capacities", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[32, 256])
+    parser.add_argument("--calls", type=int, default=500)
+    args = parser.parse_args()
+
+    for capacity in args.capacities:
+        for batch_size in args.batch_sizes:
+            insert, sample, update, uniform = bench(capacity, batch_size, args.calls)
+            print(f"cap={capacity:>9d} batch={batch_size:4d}  insert {insert * 1e6:6.2f} us/trans  "
+                  f"sample {sample * 1e6:7.1f} us  update {update * 1e6:7.1f} us  (uniforme {uniform * 1e6:6.1f} us)")
@@ -0,0 +1,98 @@
+"""Custo de gravar uma partida com EpisodeRecorder e de ler de volta com memmap.
+
+Joga o pula ou morre (com moedas) sem janela, com e sem gravação, e mostra
+o custo por frame da gravação em relação ao frame sem tela e ao frame com
+DirtyRenderer (~80 us, ver bench_hud_render.py). Depois confere a gravação:
+colunas iguais ao que foi jogado, as ações gravadas reproduzem as mesmas
+recompensas num JumpEnv com a mesma seed, e a gravação enche um
+ReplayBuffer do rocket-game para treino offline.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "rocket-game", "stage-1"))
+
+import numpy as np
+
+from jump_env import JumpEnv
+from policy import load_policy
+from recorder import EpisodeReader, EpisodeRecorder
+from replay_memory import ReplayBuffer
+
+RENDERED_FRAME_US = 80
+
+
+def play(policy, frames, seed, recorder=None, played=None):
+    env = JumpEnv(with_coins=policy.state_size == 6, seed=seed)
+    state = env.get_state()
+    start = time.perf_counter()
+    for _ in range(frames):
+        action = policy.act(state)
+        next_state, reward, done, _ = env.step(action)
+        if recorder is not None:
+            recorder.record(state, action, reward, done, policy.last_q_values)
+        if played is not None:
+            played.append((state[0], action, reward, done))
+        state = next_state
+    if recorder is not None:
+        recorder.close()
+    return (time.perf_counter() - start) / frames
+
+
+def replay_actions(reader, seed, with_coins):
+    env = JumpEnv(with_coins=with_coins, seed=seed)
+    rewards = [env.step(int(action))[1] for action in reader.column("action")]
+    return np.array(rewards, dtype=np.float32)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--model", default=os.path.join(ROOT, "models-ok", "model-gm--0.7-mem--2000-relu32-relu64.h5"))
+    parser.add_argument("--frames", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk-size", type=int, default=4096)
+    args = parser.parse_args()
+
+    policy = load_policy(args.model)
+    plain_s = play(policy, args.frames, args.seed)
+    played = []
+    play(policy, args.frames, args.seed, played=played)
+    with tempfile.TemporaryDirectory() as directory:
+        recorder = EpisodeRecorder(directory, policy.state_size, 2, chunk_size=args.chunk_size)
+        recorded_s = play(policy, args.frames, args.seed, recorder)
+        overhead_us = (recorded_s - plain_s) * 1e6
+        size = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+        print(f"sem gravação   {plain_s * 1e6:6.2f} us/frame (sem tela)")
+        print(f"com gravação   {recorded_s * 1e6:6.2f} us/frame  (+{overhead_us:.2f} us: {overhead_us / (plain_s * 1e6):.1%} "
+              f"do frame sem tela, {overhead_us / RENDERED_FRAME_US:.1%} de um frame desenhado)")
+        print(f"{args.frames} frames em {size / 2 ** 20:.1f} MiB ({size / args.frames:.0f} bytes/frame)")
+
+        start = time.perf_counter()
+        reader = EpisodeReader(directory)
+        open_s = time.perf_counter() - start
+        start = time.perf_counter()
+        total = sum(float(chunk["reward"].sum()) for chunk in reader.chunks)
+        scan_s = time.perf_counter() - start
+        print(f"abrir {open_s * 1e3:.2f} ms ({len(reader.chunks)} blocos)  varrer a coluna reward {scan_s * 1e3:.2f} ms")
+
+        assert len(reader) == args.frames
+        assert np.array_equal(reader.column("obs"), np.array([row[0] for row in played], dtype=np.float32))
+        assert np.array_equal(reader.column("action"), np.array([row[1] for row in played]))
+        assert np.array_equal(reader.column("reward"), np.array([row[2] for row in played], dtype=np.float32))
+        assert np.array_equal(reader.column("done"), np.array([row[3] for row in played]))
+        assert not np.isnan(reader.column("q_values")).any()
+        print("colunas iguais ao que foi jogado")
+
+        replayed = replay_actions(reader, args.seed, policy.state_size == 6)
+        assert np.array_equal(replayed, reader.column("reward")), "as ações gravadas deveriam reproduzir as recompensas"
+        print(f"replay sem tela: mesmas recompensas em {len(replayed)} frames (total {total:.1f})")
+
+        memory = reader.fill_replay(ReplayBuffer(args.frames, policy.state_size))
+        assert len(memory) == args.frames - 1
+        assert np.array_equal(memory.next_states[:len(memory) - 1], memory.states[1:len(memory)])
+        print(f"ReplayBuffer com {len(memory)} transições para treino offline")
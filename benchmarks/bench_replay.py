@@ -0,0 +1,42 @@
+"""Transições/s do DQNAgent.replay: replay antigo (uma amostra por vez) vs. batched."""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "rocket-game", "stage-1"))
+
+from dqn_agent import DQNAgent
+
+
+def fill_memory(agent, size, rng):
+    for _ in range(size):
+        state = rng.random(agent.state_size)
+        next_state = rng.random(agent.state_size)
+        agent.remember(state, int(rng.integers(agent.action_size)), float(rng.normal()), next_state, bool(rng.random() < 0.05))
+
+
+def bench(batched, calls, batch_size):
+    agent = DQNAgent(batched_replay=batched)
+    fill_memory(agent, agent.memory.capacity, np.random.default_rng(0))
+    agent.replay(batch_size)  # aquecimento (compilação do grafo)
+    start = time.perf_counter()
+    for _ in range(calls):
+        agent.replay(batch_size)
+    elapsed = time.perf_counter() - start
+    return calls * batch_size / elapsed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=20)
+    parser.add_argument("--batch-size", type=int, default=32)
+    args = parser.parse_args()
+
+    per_sample = bench(False, max(1, args.calls // 10), args.batch_size)
+    batched = bench(True, args.calls, args.batch_size)
+    print(f"per-sample: {per_sample:10.1f} transições/s")
+    print(f"batched:    {batched:10.1f} transições/s  ({batched / per_sample:.1f}x)")
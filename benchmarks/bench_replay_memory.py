@@ -0,0 +1,59 @@
+"""Custo de append/sample: deque de tuplas + random.sample vs. ReplayBuffer."""
+import argparse
+import os
+import random
+import sys
+import time
+from collections import deque
+
+import numpy as np
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "rocket-game", "stage-1"))
+
+from replay_memory import ReplayBuffer
+
+STATE_SIZE = 7
+
+
+def bench_deque(capacity, samples, batch_size):
+    memory = deque(maxlen=capacity)
+    state = np.zeros(STATE_SIZE)
+    start = time.perf_counter()
+    for _ in range(capacity):
+        memory.append((state, 0, 0.0, state, False))
+    append_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(samples):
+        minibatch = random.sample(memory, batch_size)
+        np.array([transition[0] for transition in minibatch])
+        np.array([transition[3] for transition in minibatch])
+    return append_time / capacity, (time.perf_counter() - start) / samples
+
+
+def bench_ring(capacity, samples, batch_size):
+    memory = ReplayBuffer(capacity, STATE_SIZE)
+    state = np.zeros(STATE_SIZE)
+    start = time.perf_counter()
+    for _ in range(capacity):
+        memory.append(state, 0, 0.0, state, False)
+    append_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(samples):
+        memory.sample(batch_size)
+    return append_time / capacity, (time.perf_counter() - start) / samples
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--capacities", type=int, nargs="+", default=[2000, 100_000, 1_000_000])
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=32)
+    args = parser.parse_args()
+
+    for capacity in args.capacities:
+        for name, bench in (("deque", bench_deque), ("ring", bench_ring)):
+            append_s, sample_s = bench(capacity, args.samples, args.batch_size)
+            print(f"{name:5s} cap={capacity:>9d}  append {append_s * 1e6:7.2f} us  sample {sample_s * 1e6:9.1f} us")
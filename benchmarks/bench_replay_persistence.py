@@ -0,0 +1,100 @@
+"""Memória de replay em memmap: custo de append/sample e tempo para retomar.
+
+Compara o ReplayBuffer em RAM com o mesmo buffer em memmap e mede o tempo de
+reabrir a pasta (retomada do treino) contra salvar/carregar tudo com np.savez.
+Confere também que o buffer reaberto tem exatamente o mesmo conteúdo.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "rocket-game", "stage-1"))
+
+from replay_memory import ReplayBuffer
+
+STATE_SIZE = 7
+
+
+def fill(memory, count, chunk=10_000):
+    rng = np.random.default_rng(0)
+    start = time.perf_counter()
+    for offset in range(0, count, chunk):
+        size = min(chunk, count - offset)
+        memory.extend(rng.random((size, STATE_SIZE), dtype=np.float32), rng.integers(0, 3, size),
+                      rng.random(size, dtype=np.float32), rng.random((size, STATE_SIZE), dtype=np.float32),
+                      rng.random(size) < 0.01)
+    return time.perf_counter() - start
+
+
+def bench_append(memory, count):
+    state = np.zeros(STATE_SIZE, dtype=np.float32)
+    start = time.perf_counter()
+    for _ in range(count):
+        memory.append(state, 0, 0.0, state, False)
+    return (time.perf_counter() - start) / count
+
+
+def bench_sample(memory, samples, batch_size):
+    start = time.perf_counter()
+    for _ in range(samples):
+        memory.sample(batch_size)
+    return (time.perf_counter() - start) / samples
+
+
+def columns(memory):
+    return (memory.states, memory.actions, memory.rewards, memory.next_states, memory.dones)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--capacity", type=int, default=1_000_000)
+    parser.add_argument("--appends", type=int, default=100_000)
+    parser.add_argument("--samples", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=32)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "replay")
+        memory = ReplayBuffer(args.capacity, STATE_SIZE)
+        mapped = ReplayBuffer(args.capacity, STATE_SIZE, path=path)
+        for name, buffer in (("ram", memory), ("memmap", mapped)):
+            fill_s = fill(buffer, args.capacity)
+            append_s = bench_append(buffer, args.appends)
+            sample_s = bench_sample(buffer, args.samples, args.batch_size)
+            print(f"{name:6s} preencher {fill_s:6.2f} s  append {append_s * 1e6:6.2f} us  "
+                  f"sample({args.batch_size}) {sample_s * 1e6:7.1f} us")
+
+        # Retomada: np.savez/np.load do buffer inteiro vs. reabrir os memmaps
+        snapshot = os.path.join(directory, "replay.npz")
+        start = time.perf_counter()
+        np.savez(snapshot, *columns(memory))
+        save_s = time.perf_counter() - start
+        start = time.perf_counter()
+        with np.load(snapshot) as data:
+            [data[key] for key in data.files]
+        load_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        mapped.flush()
+        flush_s = time.perf_counter() - start
+        cursor, size = mapped.cursor, mapped.size
+        del mapped
+        start = time.perf_counter()
+        reopened = ReplayBuffer(args.capacity, STATE_SIZE, path=path)
+        reopen_s = time.perf_counter() - start
+
+        print(f"np.savez {save_s * 1000:8.1f} ms  np.load {load_s * 1000:8.1f} ms")
+        print(f"flush    {flush_s * 1000:8.1f} ms  reabrir {reopen_s * 1000:8.3f} ms")
+
+        assert (reopened.cursor, reopened.size) == (cursor, size)
+        memory_again = ReplayBuffer(args.capacity, STATE_SIZE)
+        fill(memory_again, args.capacity)
+        bench_append(memory_again, args.appends)
+        for expected, actual in zip(columns(memory_again), columns(reopened)):
+            assert np.array_equal(expected, actual)
+        print(f"Conteúdo idêntico após reabrir (cursor {cursor}, {size} transições)")
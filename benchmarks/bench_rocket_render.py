@@ -0,0 +1,91 @@
+"""Custo por frame de Rocket.draw: transform.rotate a cada frame vs. RotationCache.
+
+Roda o foguete com ações aleatórias (os ângulos variam como no treino) e mede
+só o desenho do foguete (sem o screen.fill, que custa igual nas duas versões),
+sem limite de FPS, para o retângulo vermelho e para os PNGs.
+Confere também que o sprite do cache é igual ao rotacionado direto.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "rocket-game", "stage-1"))
+
+import pygame
+
+from rocket_env import RocketEnv, RotationCache, load_rocket_sprites
+
+
+def record_frames(frames, seed):
+    # (center, angle, thrust) de cada frame, para as duas versões desenharem a mesma coisa
+    random.seed(seed)
+    env = RocketEnv()
+    recorded = []
+    for _ in range(frames):
+        _, _, done, _ = env.step(random.randrange(3))
+        rocket = env.rocket
+        recorded.append((rocket.rocket_rect.center, rocket.noise_angle, rocket.thrust))
+        if done:
+            env.reset()
+    return recorded
+
+
+def draw_direct(screen, cache, recorded):
+    start = time.perf_counter()
+    for center, angle, thrust in recorded:
+        sprite = cache.sprites["thrusted" if thrust and "thrusted" in cache else "idle"]
+        rotated_image = pygame.transform.rotate(sprite, -angle)
+        screen.blit(rotated_image, rotated_image.get_rect(center=center).topleft)
+    return (time.perf_counter() - start) / len(recorded)
+
+
+def draw_cached(screen, cache, recorded):
+    start = time.perf_counter()
+    for center, angle, thrust in recorded:
+        rotated_image = cache.get("thrusted" if thrust and "thrusted" in cache else "idle", -angle)
+        screen.blit(rotated_image, rotated_image.get_rect(center=center).topleft)
+    return (time.perf_counter() - start) / len(recorded)
+
+
+def check_parity(cache):
+    for name in cache.sprites:
+        for angle in (-35, -12.3, 0, 0.1, 7.7, 35):
+            quantized = round(angle / cache.resolution) * cache.resolution
+            expected = pygame.transform.rotate(cache.sprites[name], quantized)
+            actual = cache.get(name, angle)
+            assert expected.get_size() == actual.get_size()
+            assert pygame.image.tobytes(expected, "RGBA") == pygame.image.tobytes(actual, "RGBA")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--frames", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((1000, 750))
+    recorded = record_frames(args.frames, args.seed)
+    angles = len({round(angle, 1) for _, angle, _ in recorded})
+    print(f"{args.frames} frames, {angles} ângulos distintos")
+
+    red = pygame.Surface((30, 47), pygame.SRCALPHA)
+    red.fill((255, 0, 0))
+    for name, make_cache in (("retângulo", lambda: RotationCache({"idle": red})), ("png", load_rocket_sprites)):
+        direct = draw_direct(screen, make_cache(), recorded)
+        cache = make_cache()
+        cached = draw_cached(screen, cache, recorded)
+        warm = make_cache()
+        start = time.perf_counter()
+        warm.warm()
+        warm_s = time.perf_counter() - start
+        check_parity(make_cache())
+        print(f"{name:10s} rotate {direct * 1e6:7.1f} us/frame  cache {cached * 1e6:7.1f} us/frame "
+              f"({direct / cached:4.1f}x)  {len(cache)} sprites, acertos {cache.hits / (cache.hits + cache.misses):.1%}  "
+              f"warm {warm_s * 1000:.1f} ms")
+    pygame.quit()
@@ -0,0 +1,51 @@
+"""Paridade VectorRocketEnv x Rocket (rocket_parity.py, em N maior que nos testes) e passos/s em N=1, 64 e 1024."""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "rocket-game", "stage-1"))
+
+from rocket_env import VectorRocketEnv
+from rocket_parity import (SCREEN_HEIGHT, SCREEN_WIDTH, check_parity, check_step_parity, check_target_seeds,
+                           scalar_rockets)
+
+
+def bench_vector(n, steps):
+    env = VectorRocketEnv(n, seed=0)
+    actions = np.random.default_rng(0).integers(0, 3, size=(steps, n))
+    start = time.perf_counter()
+    for step in range(steps):
+        env.step(actions[step])
+    return n * steps / (time.perf_counter() - start)
+
+
+def bench_scalar(n, steps):
+    env = VectorRocketEnv(n, seed=0)
+    rockets, targets = scalar_rockets(env)
+    actions = np.random.default_rng(0).integers(0, 3, size=(steps, n)).tolist()
+    start = time.perf_counter()
+    for step in range(steps):
+        for rocket, target, action in zip(rockets, targets, actions[step]):
+            rocket.handle_input(action)
+            rocket.update(SCREEN_WIDTH, SCREEN_HEIGHT)
+            target.calculate_distance_to_rocket(rocket.rocket_rect)
+    return n * steps / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 64, 1024])
+    parser.add_argument("--steps", type=int, default=500)
+    args = parser.parse_args()
+
+    print(f"paridade ok ({check_parity()} passos comparados)")
+    print(f"alvos com seed iguais ao RocketEnv ({check_target_seeds()} sorteios comparados)")
+    print(f"step com action_repeat=4 igual ao RocketEnv ({check_step_parity(32, 1000, action_repeat=4)} passos comparados)")
+    for n in args.sizes:
+        scalar = bench_scalar(n, max(1, args.steps * 64 // max(n, 64)))
+        vector = bench_vector(n, args.steps)
+        print(f"N={n:5d}  Rocket {scalar:12.0f} passos/s  VectorRocketEnv {vector:12.0f} passos/s  ({vector / scalar:.1f}x)")
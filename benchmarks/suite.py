@@ -0,0 +1,286 @@
+"""Suíte de benchmarks dos caminhos quentes, com resultado em JSON para comparar entre commits.
+
+Cada caso prepara o que precisa e devolve (run, ops) ou (run, ops, cleanup):
+run() é cronometrado repeat vezes e o resultado é o melhor tempo por
+operação (e a mediana); cleanup(), se houver, roda no fim da medição.
+Os casos com TensorFlow só importam o que precisam quando são escolhidos.
+
+    python benchmarks/suite.py                          # grava benchmarks/results/<commit>.json
+    python benchmarks/suite.py --cases replay act       # só os casos com esses trechos no nome
+    python benchmarks/suite.py --compare benchmarks/results/abc1234.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "rocket-game", "stage-1"))
+
+import numpy as np
+
+CASES = {}
+
+
+def case(name):
+    def register(setup):
+        CASES[name] = setup
+        return setup
+    return register
+
+
+@case("Rocket.update")
+def rocket_update():
+    from rocket_env import Rocket
+
+    rocket = Rocket(475, 703, 30, 47)
+    actions = np.random.default_rng(0).integers(0, 4, size=10_000).tolist()
+
+    def run():
+        for frame, action in enumerate(actions):
+            if frame % 20 == 0:
+                rocket.handle_input(action)
+            rocket.update(1000, 750)
+    return run, len(actions)
+
+
+@case("Player.update")
+def player_update():
+    from jump_env import Player
+
+    player = Player()
+
+    def run():
+        for frame in range(10_000):
+            if frame % 40 == 0:
+                player.jump()
+            player.update()
+    return run, 10_000
+
+
+@case("JumpEnv.check_collision + check_capture_coin")
+def jump_checks():
+    from jump_env import JumpEnv
+
+    env = JumpEnv(with_coins=True, seed=0)
+    # Obstáculo e moeda passando por toda a tela, com o jogador no chão e no ar
+    positions = [(x, y) for x in range(800, -60, -7) for y in (env.player.y, env.player.y - 120)]
+
+    def run():
+        for x, y in positions:
+            env.player.y = y
+            env.obstacle.x = x
+            env.coin.x = x
+            env.check_collision()
+            env.check_capture_coin()
+    return run, len(positions)
+
+
+@case("JumpEnv.get_state (4 features)")
+def jump_state_4():
+    from jump_env import JumpEnv
+
+    env = JumpEnv(seed=0)
+
+    def run():
+        for _ in range(5_000):
+            env.get_state()
+    return run, 5_000
+
+
+@case("JumpEnv.get_state (6 features)")
+def jump_state_6():
+    from jump_env import JumpEnv
+
+    env = JumpEnv(with_coins=True, seed=0)
+
+    def run():
+        for _ in range(5_000):
+            env.get_state()
+    return run, 5_000
+
+
+@case("RocketEnv.get_state")
+def rocket_state():
+    from rocket_env import RocketEnv
+
+    env = RocketEnv(seed=0)
+
+    def run():
+        for _ in range(5_000):
+            env.get_state()
+    return run, 5_000
+
+
+@case("JumpEnvBatch.get_state (256 jogos)")
+def batch_state():
+    from jump_env import JumpEnvBatch
+
+    env = JumpEnvBatch(256, with_coins=True, seed=0)
+
+    def run():
+        for _ in range(1_000):
+            env.get_state()
+    return run, 1_000 * 256
+
+
+def make_agent(memory_size=10_000):
+    from dqn_agent import DQNAgent
+
+    agent = DQNAgent(memory_size=memory_size, seed=0)
+    rng = np.random.default_rng(0)
+    states = rng.random((memory_size, agent.state_size), dtype=np.float32)
+    agent.memory.extend(states, rng.integers(0, agent.action_size, size=memory_size), rng.random(memory_size),
+                        np.roll(states, -1, axis=0), rng.random(memory_size) < 0.01)
+    return agent
+
+
+@case("DQNAgent.act")
+def agent_act():
+    agent = make_agent(100)
+    agent.epsilon = 0.0
+    state = np.zeros(agent.state_size, dtype=np.float32)
+    agent.act(state)
+
+    def run():
+        for _ in range(20):
+            agent.act(state)
+    return run, 20
+
+
+@case("DQNAgent.act_batch (64 estados)")
+def agent_act_batch():
+    agent = make_agent(100)
+    agent.epsilon = 0.0
+    states = np.zeros((64, agent.state_size), dtype=np.float32)
+    agent.act_batch(states)
+
+    def run():
+        for _ in range(50):
+            agent.act_batch(states)
+    return run, 50
+
+
+def replay_case(batch_size):
+    def setup():
+        agent = make_agent()
+        agent.replay(batch_size)
+
+        def run():
+            for _ in range(20):
+                agent.replay(batch_size)
+        return run, 20
+    return setup
+
+
+for replay_batch_size in (32, 64, 256):
+    case(f"DQNAgent.replay (batch {replay_batch_size})")(replay_case(replay_batch_size))
+
+
+@case("DQNAgent.save_model")
+def agent_save():
+    agent = make_agent(100)
+    # Fora da pasta do rocket-game, para não sobrescrever os .h5 versionados
+    directory = tempfile.TemporaryDirectory()
+
+    def run():
+        agent.save_model(directory.name)
+    return run, 1, directory.cleanup
+
+
+@case("treino headless do pula ou morre (frames)")
+def jump_training():
+    from jump_train import train
+
+    def run():
+        train(lanes=16, steps=300, eval_every=10 ** 9, eval_frames=10, verbose=False)
+    return run, 300 * 16
+
+
+def measure(setup, repeat):
+    run, ops, *cleanup = setup()
+    try:
+        run()
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            times.append(time.perf_counter() - start)
+    finally:
+        for function in cleanup:
+            function()
+    best, median = min(times), float(np.median(times))
+    return {
+        "ops_per_sec": ops / best,
+        "us_per_op": best / ops * 1e6,
+        "median_us_per_op": median / ops * 1e6,
+        "ops": ops,
+        "repeat": repeat,
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "desconhecido"
+
+
+def compare(results, baseline, threshold):
+    regressions = []
+    for name, result in results.items():
+        old = baseline["results"].get(name)
+        if old is None:
+            continue
+        ratio = result["us_per_op"] / old["us_per_op"]
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  <- REGRESSÃO"
+            regressions.append(name)
+        print(f"{name:48s} {old['us_per_op']:12.3f} -> {result['us_per_op']:12.3f} us/op  ({ratio:5.2f}x){flag}")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cases", nargs="*", default=None, help="trechos do nome dos casos a rodar")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", default=None, help="padrão: benchmarks/results/<commit>.json")
+    parser.add_argument("--compare", default=None, help="JSON de uma execução anterior")
+    parser.add_argument("--threshold", type=float, default=0.1, help="piora relativa que conta como regressão")
+    args = parser.parse_args()
+
+    names = [name for name in CASES if not args.cases or any(part.lower() in name.lower() for part in args.cases)]
+    commit = git_commit()
+    results = {}
+    for name in names:
+        results[name] = measure(CASES[name], args.repeat)
+        print(f"{name:48s} {results[name]['us_per_op']:12.3f} us/op  {results[name]['ops_per_sec']:14.0f} ops/s")
+
+    report = {
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.platform(),
+        "cpus": os.cpu_count(),
+        "results": results,
+    }
+    output = args.output or os.path.join(ROOT, "benchmarks", "results", f"{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Resultados em {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        print(f"Comparando com {baseline['commit']} ({baseline['timestamp']})")
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
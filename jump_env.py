@@ -0,0 +1,403 @@
+import random
+import numpy as np
+
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 400
+
+PLAYER_X = 100
+PLAYER_SIZE = 50
+PLAYER_VELOCITY = 10
+JUMP_HEIGHT = 150
+GROUND_Y = SCREEN_HEIGHT - PLAYER_SIZE - 10
+
+OBSTACLE_SIZE = 50
+OBSTACLE_Y = SCREEN_HEIGHT - OBSTACLE_SIZE - 10
+
+COIN_SIZE = 20
+COIN_Y = SCREEN_HEIGHT - COIN_SIZE - 100
+
+PENALTY_COLLISION = -5
+
+
+def child_seeds(seed, n):
+    """n SeedSequences filhas de seed (int, SeedSequence ou None).
+
+    Mesmo resultado de SeedSequence(seed).spawn(n), mas sem mudar o estado de
+    uma SeedSequence recebida: a mesma seed gera sempre as mesmas filhas.
+    """
+    parent = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    return [np.random.SeedSequence(parent.entropy, spawn_key=parent.spawn_key + (i,), pool_size=parent.pool_size)
+            for i in range(n)]
+
+
+class RandomStream:
+    """randint no estilo do módulo random, tirado de um numpy Generator próprio.
+
+    Cada sorteio consome um único double do Generator, então RandomStreams com
+    a mesma seed em uma das linhas devolve exatamente a mesma sequência.
+    """
+
+    __slots__ = ("rng",)
+
+    def __init__(self, seed):
+        self.rng = np.random.default_rng(seed)
+
+    def randint(self, low, high):
+        return low + int(self.rng.random() * (high - low + 1))
+
+
+class RandomStreams:
+    """Um RandomStream por ambiente, sorteando só para os índices pedidos.
+
+    Os doubles de cada Generator vêm em blocos de block_size, então um sorteio
+    para vários ambientes é uma indexação NumPy; só quem esgotou o bloco volta
+    ao seu Generator.
+    """
+
+    def __init__(self, seeds, block_size=64):
+        self.rngs = [np.random.default_rng(seed) for seed in seeds]
+        self.block_size = block_size
+        self.blocks = np.stack([rng.random(block_size) for rng in self.rngs])
+        self.cursors = np.zeros(len(self.rngs), dtype=np.int64)
+
+    def randint(self, low, high, indices):
+        for i in indices[self.cursors[indices] == self.block_size]:
+            self.blocks[i] = self.rngs[i].random(self.block_size)
+            self.cursors[i] = 0
+        values = self.blocks[indices, self.cursors[indices]]
+        self.cursors[indices] += 1
+        return low + (values * (high - low + 1)).astype(np.int64)
+
+
+def collides(a, b):
+    # Mesmo teste AABB estrito do Rect.colliderect, sem criar Rects
+    return (a.x < b.x + b.width and b.x < a.x + a.width
+            and a.y < b.y + b.height and b.y < a.y + a.height)
+
+
+class Player:
+    __slots__ = ("width", "height", "x", "y", "velocity", "is_jumping", "jump_height", "jump_peak", "on_ground")
+
+    def __init__(self):
+        self.width = PLAYER_SIZE
+        self.height = PLAYER_SIZE
+        self.x = PLAYER_X
+        self.y = GROUND_Y
+        self.velocity = PLAYER_VELOCITY
+        self.is_jumping = False
+        self.jump_height = JUMP_HEIGHT
+        self.on_ground = True
+
+    def jump(self):
+        if self.on_ground:
+            self.is_jumping = True
+            self.jump_peak = self.y - self.jump_height
+            self.on_ground = False
+
+    def update(self):
+        if self.is_jumping:
+            if self.y > self.jump_peak:
+                self.y -= self.velocity
+            else:
+                self.is_jumping = False
+        elif self.y < GROUND_Y:
+            self.y += self.velocity
+        else:
+            self.on_ground = True
+            self.y = GROUND_Y
+
+
+class Obstacle:
+    __slots__ = ("width", "height", "x", "y", "rng", "velocity", "passed_player")
+
+    def __init__(self, initial_velocity=(6, 12), rng=random):
+        self.width = OBSTACLE_SIZE
+        self.height = OBSTACLE_SIZE
+        self.x = SCREEN_WIDTH
+        self.y = OBSTACLE_Y
+        self.rng = rng
+        self.velocity = self.rng.randint(*initial_velocity)
+        self.passed_player = False
+
+    def update(self):
+        self.x -= self.velocity
+        if self.x < -self.width:
+            self.reset()
+
+    def reset(self):
+        self.x = SCREEN_WIDTH
+        self.velocity = self.rng.randint(6, 12)
+        self.passed_player = False
+
+
+class Coin:
+    __slots__ = ("width", "height", "x", "y", "velocity_range", "rng", "velocity", "passed_player")
+
+    def __init__(self, velocity_range=(9, 25), rng=random):
+        self.width = COIN_SIZE
+        self.height = COIN_SIZE
+        self.x = SCREEN_WIDTH
+        self.y = COIN_Y
+        self.velocity_range = velocity_range
+        self.rng = rng
+        self.velocity = self.rng.randint(*velocity_range)
+        self.passed_player = False
+
+    def update(self):
+        self.x -= self.velocity
+        if self.x <= 0:
+            self.reset()
+
+    def reset(self):
+        self.x = SCREEN_WIDTH
+        self.velocity = self.rng.randint(*self.velocity_range)
+        self.passed_player = False
+
+
+class JumpEnv:
+    """Um jogo do pula ou morre com API reset()/step(), sem tela nem relógio.
+
+    with_coins escolhe as regras do app-with-coins.py em vez das do app.py
+    (veja JumpEnvBatch). step devolve (state, reward, done, info), com done
+    verdadeiro no passo em que o jogador bate no obstáculo.
+    Obstáculo e moeda sorteiam de RandomStreams próprios, filhos de seed (int ou
+    SeedSequence): a sequência de velocidades do obstáculo não depende de
+    quando a moeda é pega, e é a mesma da linha i de um JumpEnvBatch quando
+    seed = child_seeds(seed_do_batch, n)[i]. Sem seed, cada reset sorteia outra.
+    Com action_repeat=k cada step repete a ação por k frames (como segurar a
+    tecla) e soma as recompensas; done marca batida em qualquer um deles.
+    """
+
+    def __init__(self, with_coins=False, seed=None, action_repeat=1):
+        self.with_coins = with_coins
+        self.seed = seed
+        self.action_repeat = action_repeat
+        self.state_size = 6 if with_coins else 4
+        self.penalty_collision = PENALTY_COLLISION
+        self.reset()
+
+    def reset(self, seed=None):
+        if seed is not None:
+            self.seed = seed
+        obstacle_seed, coin_seed = child_seeds(self.seed, 2)
+        self.player = Player()
+        self.obstacle = Obstacle(initial_velocity=(6, 12) if self.with_coins else (6, 10), rng=RandomStream(obstacle_seed))
+        self.coin = Coin(velocity_range=(16, 25) if self.with_coins else (9, 25), rng=RandomStream(coin_seed))
+        self.score = 0
+        self.coins = 0
+        self.errors = 0
+        return self.get_state()
+
+    def update(self):
+        self.player.update()
+        self.obstacle.update()
+        self.coin.update()
+
+    def check_collision(self):
+        if self.with_coins and (self.obstacle.x + self.obstacle.width) < self.player.x:
+            return 0.5
+        if collides(self.player, self.obstacle):
+            self.errors += 1
+            self.obstacle.reset()
+            return self.penalty_collision
+        return 0
+
+    def check_capture_coin(self):
+        if collides(self.player, self.coin) and not self.coin.passed_player:
+            self.coins += 1
+            self.coin.reset()
+            return 20
+        return 0
+
+    def check_pass(self):
+        if (self.obstacle.x + self.obstacle.width) < self.player.x:
+            self.score += 1
+            self.obstacle.passed_player = True
+            self.obstacle.reset()
+            return 20
+        return 0
+
+    def step(self, action):
+        errors = self.errors
+        reward = 0
+        for _ in range(self.action_repeat):
+            reward += self.advance(action)
+        info = {"score": self.score, "errors": self.errors, "coins": self.coins}
+        return self.get_state(), reward, self.errors > errors, info
+
+    def advance(self, action):
+        """Um frame do jogo; devolve a recompensa do frame."""
+        if action == 1 and not self.player.is_jumping:
+            self.player.jump()
+
+        if not self.with_coins:
+            self.update()
+        reward = self.check_capture_coin()
+        reward += self.check_collision()
+        reward += self.check_pass()
+        if self.with_coins:
+            self.update()
+        return reward
+
+    def get_state(self):
+        if self.with_coins:
+            return np.array([
+                (self.player.x - self.obstacle.x) / SCREEN_WIDTH,
+                self.obstacle.velocity / 12,
+                (self.player.y - self.obstacle.y) / SCREEN_HEIGHT,
+                (self.player.x - self.coin.x) / SCREEN_WIDTH,
+                self.coin.velocity / 25,
+                int(self.player.on_ground),
+            ]).reshape(1, 6)
+        return np.array([
+            self.obstacle.x / SCREEN_WIDTH,
+            self.obstacle.velocity / 12,
+            int(self.player.on_ground),
+            (self.player.y - self.obstacle.y) / SCREEN_HEIGHT
+        ]).reshape(1, 4)
+
+
+class JumpEnvBatch:
+    """N jogos independentes do pula ou morre simulados com NumPy, sem pygame.
+
+    with_coins=False segue o app.py (colisão depois do update, estado com 4
+    features); with_coins=True segue o app-with-coins.py (checagens antes do
+    update, +0.5 por obstáculo já ultrapassado, estado com 6 features).
+    O jogo nunca termina: dones marca os jogos que bateram no obstáculo neste
+    passo, e o obstáculo volta para o início como no jogo original.
+    action_repeat funciona como em JumpEnv. Cada linha i sorteia como um
+    JumpEnv(seed=child_seeds(seed, n)[i]), bit a bit.
+    """
+
+    def __init__(self, n, with_coins=False, seed=None, action_repeat=1):
+        self.n = n
+        self.with_coins = with_coins
+        self.action_repeat = action_repeat
+        self.state_size = 6 if with_coins else 4
+        self.initial_obstacle_velocity = (6, 12) if with_coins else (6, 10)
+        self.obstacle_velocity_range = (6, 12)
+        self.coin_velocity_range = (16, 25) if with_coins else (9, 25)
+        self.seed = seed
+        self.reset()
+
+    def reset(self):
+        n = self.n
+        lanes = [child_seeds(lane_seed, 2) for lane_seed in child_seeds(self.seed, n)]
+        self.obstacle_streams = RandomStreams([obstacle_seed for obstacle_seed, _ in lanes])
+        self.coin_streams = RandomStreams([coin_seed for _, coin_seed in lanes])
+        everyone = np.arange(n)
+        self.player_y = np.full(n, GROUND_Y, dtype=np.int64)
+        self.jump_peak = np.zeros(n, dtype=np.int64)
+        self.is_jumping = np.zeros(n, dtype=bool)
+        self.on_ground = np.ones(n, dtype=bool)
+        self.obstacle_x = np.full(n, SCREEN_WIDTH, dtype=np.int64)
+        self.obstacle_velocity = self.obstacle_streams.randint(*self.initial_obstacle_velocity, everyone)
+        self.coin_x = np.full(n, SCREEN_WIDTH, dtype=np.int64)
+        self.coin_velocity = self.coin_streams.randint(*self.coin_velocity_range, everyone)
+        self.score = np.zeros(n, dtype=np.int64)
+        self.errors = np.zeros(n, dtype=np.int64)
+        self.coins = np.zeros(n, dtype=np.int64)
+        return self.get_state()
+
+    def reset_obstacles(self, mask):
+        indices = np.flatnonzero(mask)
+        self.obstacle_x[indices] = SCREEN_WIDTH
+        self.obstacle_velocity[indices] = self.obstacle_streams.randint(*self.obstacle_velocity_range, indices)
+
+    def reset_coins(self, mask):
+        indices = np.flatnonzero(mask)
+        self.coin_x[indices] = SCREEN_WIDTH
+        self.coin_velocity[indices] = self.coin_streams.randint(*self.coin_velocity_range, indices)
+
+    def jump(self, actions):
+        jumping = (actions == 1) & ~self.is_jumping & self.on_ground
+        self.is_jumping |= jumping
+        self.jump_peak = np.where(jumping, self.player_y - JUMP_HEIGHT, self.jump_peak)
+        self.on_ground &= ~jumping
+
+    def update(self):
+        # Player.update
+        rising = self.is_jumping & (self.player_y > self.jump_peak)
+        peaked = self.is_jumping & ~rising
+        falling = ~self.is_jumping & (self.player_y < GROUND_Y)
+        landed = ~self.is_jumping & ~falling
+        self.player_y = self.player_y - PLAYER_VELOCITY * rising + PLAYER_VELOCITY * falling
+        self.player_y[landed] = GROUND_Y
+        self.is_jumping &= ~peaked
+        self.on_ground |= landed
+
+        # Obstacle.update / Coin.update
+        self.obstacle_x -= self.obstacle_velocity
+        self.reset_obstacles(self.obstacle_x < -OBSTACLE_SIZE)
+        self.coin_x -= self.coin_velocity
+        self.reset_coins(self.coin_x <= 0)
+
+    def overlaps_player(self, x, y, width, height):
+        # Versão vetorizada de collides()
+        return ((PLAYER_X < x + width) & (x < PLAYER_X + PLAYER_SIZE)
+                & (self.player_y < y + height) & (y < self.player_y + PLAYER_SIZE))
+
+    def check_capture_coin(self):
+        captured = self.overlaps_player(self.coin_x, COIN_Y, COIN_SIZE, COIN_SIZE)
+        self.coins += captured
+        self.reset_coins(captured)
+        return 20.0 * captured
+
+    def check_collision(self):
+        rewards = np.zeros(self.n)
+        collided = self.overlaps_player(self.obstacle_x, OBSTACLE_Y, OBSTACLE_SIZE, OBSTACLE_SIZE)
+        if self.with_coins:
+            cleared = self.obstacle_x + OBSTACLE_SIZE < PLAYER_X
+            rewards[cleared] = 0.5
+            collided &= ~cleared
+        rewards[collided] = PENALTY_COLLISION
+        self.errors += collided
+        self.reset_obstacles(collided)
+        return rewards, collided
+
+    def check_pass(self):
+        passed = self.obstacle_x + OBSTACLE_SIZE < PLAYER_X
+        self.score += passed
+        self.reset_obstacles(passed)
+        return 20.0 * passed
+
+    def step(self, actions):
+        actions = np.asarray(actions)
+        rewards, dones = self.advance(actions)
+        for _ in range(self.action_repeat - 1):
+            frame_rewards, frame_dones = self.advance(actions)
+            rewards += frame_rewards
+            dones |= frame_dones
+        return self.get_state(), rewards, dones
+
+    def advance(self, actions):
+        self.jump(actions)
+        if not self.with_coins:
+            self.update()
+        rewards = self.check_capture_coin()
+        collision_rewards, dones = self.check_collision()
+        rewards += collision_rewards
+        rewards += self.check_pass()
+        if self.with_coins:
+            self.update()
+        return rewards, dones
+
+    def get_state(self):
+        obstacle_dy = (self.player_y - OBSTACLE_Y) / SCREEN_HEIGHT
+        if self.with_coins:
+            columns = [
+                (PLAYER_X - self.obstacle_x) / SCREEN_WIDTH,
+                self.obstacle_velocity / 12,
+                obstacle_dy,
+                (PLAYER_X - self.coin_x) / SCREEN_WIDTH,
+                self.coin_velocity / 25,
+                self.on_ground,
+            ]
+        else:
+            columns = [
+                self.obstacle_x / SCREEN_WIDTH,
+                self.obstacle_velocity / 12,
+                self.on_ground,
+                obstacle_dy,
+            ]
+        return np.stack(columns, axis=1).astype(np.float32)
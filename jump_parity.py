@@ -0,0 +1,31 @@
+"""Conferência de paridade do JumpEnvBatch com JumpEnv escalares de seeds filhas.
+
+Usada pelos testes (tests/test_jump_env.py, N pequeno) e pelo
+benchmarks/bench_jump_batch.py (N maior, antes de medir). Levanta
+AssertionError com (passo, linha) na primeira divergência e devolve quantos
+passos comparou.
+"""
+import numpy as np
+
+from jump_env import JumpEnv, JumpEnvBatch, child_seeds
+
+
+def check_parity(n=16, steps=3000, seed=0, with_coins=False, action_repeat=1):
+    """Mesmas ações no lote e em n JumpEnv: sorteios, posições, placar, estado, recompensa e done."""
+    batch = JumpEnvBatch(n, with_coins=with_coins, seed=seed, action_repeat=action_repeat)
+    envs = [JumpEnv(with_coins=with_coins, seed=lane_seed, action_repeat=action_repeat)
+            for lane_seed in child_seeds(seed, n)]
+    actions = np.random.default_rng(seed).integers(0, 2, size=(steps, n))
+    for step in range(steps):
+        states, rewards, dones = batch.step(actions[step])
+        for i, env in enumerate(envs):
+            state, reward, done, _ = env.step(actions[step, i])
+            assert env.obstacle.velocity == batch.obstacle_velocity[i], (step, i)
+            assert env.coin.velocity == batch.coin_velocity[i], (step, i)
+            assert env.obstacle.x == batch.obstacle_x[i] and env.coin.x == batch.coin_x[i], (step, i)
+            assert env.player.y == batch.player_y[i], (step, i)
+            assert (env.score, env.errors, env.coins) == (batch.score[i], batch.errors[i], batch.coins[i]), (step, i)
+            # O lote devolve float32; o escalar, float64
+            assert np.array_equal(state[0].astype(np.float32), states[i]), (step, i)
+            assert reward == rewards[i] and done == dones[i], (step, i)
+    return n * steps
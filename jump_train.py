@@ -0,0 +1,171 @@
+"""Treino headless do pula ou morre, com 4 features (app.py) ou 6 (app-with-coins.py).
+
+Vários jogos num JumpEnvBatch, uma decisão para todos com act_batch, a
+memória de replay recebe o bloco inteiro com extend e o replay é em
+minibatch (DQNAgent do rocket-game). A recompensa é a que os jogos já dão:
++20 por obstáculo ultrapassado ou moeda, -5 por batida e +0.5 por frame com
+o obstáculo já para trás (só com moedas). A cada eval_every passos a rede
+joga sem exploração em outro JumpEnvBatch e o log mostra a taxa de acerto,
+os passos/s e quanto tempo de treino levou até chegar no alvo.
+
+    python jump_train.py --features 6 --steps 20000 --target-hit-rate 0.95
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(ROOT, "rocket-game", "stage-1"))
+
+from dqn_agent import DQNAgent
+from jump_env import JumpEnvBatch
+from metrics import MetricsLogger, Throughput
+from numpy_model import NumpyModel
+
+
+def model_name(gamma, memory_size, batch_size, hidden_layers):
+    # Mesmo padrão dos arquivos de models-ok (o tournament.py lê gamma, memória e batch do nome)
+    layers = "-".join(f"relu{units}" for units in hidden_layers)
+    return f"model-gm--{gamma}-mem--{memory_size}-bs--{batch_size}--{layers}"
+
+
+def numpy_snapshot(model):
+    """Cópia dos pesos atuais do modelo Keras num NumpyModel (o mesmo que o app usa para jogar)."""
+    weights = model.get_weights()
+    activations = [layer.get_config()["activation"] for layer in model.layers]
+    return NumpyModel([(weights[2 * i], weights[2 * i + 1], activation) for i, activation in enumerate(activations)])
+
+
+def evaluate(model, with_coins, lanes, frames, seed, action_repeat=1):
+    """Taxa de acerto (obstáculos ultrapassados / encontrados) jogando sem exploração."""
+    policy = numpy_snapshot(model)
+    env = JumpEnvBatch(lanes, with_coins=with_coins, seed=seed, action_repeat=action_repeat)
+    states = env.get_state()
+    for _ in range(frames // action_repeat):
+        states, _, _ = env.step(np.argmax(policy(states), axis=1))
+    score, errors = int(env.score.sum()), int(env.errors.sum())
+    return score / (score + errors) if score + errors else 0.0
+
+
+def train(features=4, lanes=16, steps=20000, gamma=0.7, memory_size=2000, batch_size=64, hidden_layers=(32, 64),
+          epsilon_decay=0.999, replay_every=1, target_sync_every=None, action_repeat=1, eval_every=1000,
+          eval_lanes=16, eval_frames=1000, target_hit_rate=0.95, stop_at_target=False, seed=0, output_dir=None,
+          name=None, metrics_path=None, verbose=True):
+    import tensorflow as tf
+    # Fixa a inicialização dos pesos; tf.random.set_seed sozinho não volta o gerador do Keras 3 ao início
+    tf.keras.utils.set_random_seed(seed)
+
+    agent_seed, env_seed, eval_seed = np.random.SeedSequence(seed).spawn(3)
+    with_coins = features == 6
+    # O passo das métricas é o número de frames simulados (todas as linhas somadas)
+    metrics = MetricsLogger(metrics_path) if metrics_path else None
+    agent = DQNAgent(state_size=features, action_size=2, hidden_layers=hidden_layers, gamma=gamma,
+                     memory_size=memory_size, epsilon_decay=epsilon_decay, target_sync_every=target_sync_every,
+                     seed=agent_seed, metrics=metrics)
+    env = JumpEnvBatch(lanes, with_coins=with_coins, seed=env_seed, action_repeat=action_repeat)
+    states = env.get_state()
+
+    history = []
+    target_reached = None
+    env_seconds = eval_seconds = 0.0
+    window_return = 0.0
+    throughput = Throughput()
+    start = time.perf_counter()
+    for step in range(1, steps + 1):
+        actions = agent.act_batch(states)
+        env_start = time.perf_counter()
+        next_states, rewards, dones = env.step(actions)
+        env_seconds += time.perf_counter() - env_start
+        agent.memory.extend(states, actions, rewards, next_states, dones)
+        states = next_states
+        window_return += rewards.sum()
+        if metrics is not None:
+            metrics.step = step * lanes * action_repeat
+
+        if step % replay_every == 0:
+            agent.replay(batch_size)
+
+        if step % eval_every == 0 or step == steps:
+            if metrics is not None:
+                # O jogo não termina: o "retorno" é a recompensa média por jogo desde a avaliação anterior
+                metrics.log(steps_per_sec=throughput.per_sec(step * lanes * action_repeat),
+                            env_steps_per_sec=step * lanes * action_repeat / env_seconds,
+                            episode_return=window_return / lanes)
+            window_return = 0.0
+            eval_start = time.perf_counter()
+            hit_rate = evaluate(agent.model, with_coins, eval_lanes, eval_frames, eval_seed, action_repeat)
+            eval_seconds += time.perf_counter() - eval_start
+            seconds = time.perf_counter() - start - eval_seconds
+            frames = step * lanes * action_repeat
+            row = {"step": step, "frames": frames, "seconds": seconds, "frames_per_sec": frames / seconds,
+                   "hit_rate": hit_rate, "epsilon": agent.epsilon}
+            history.append(row)
+            if metrics is not None:
+                metrics.log(hit_rate=hit_rate)
+            if target_reached is None and hit_rate >= target_hit_rate:
+                target_reached = row
+            if verbose:
+                print(f"passo {step:6d}  {frames:8d} frames  {row['frames_per_sec']:8.0f} frames/s  "
+                      f"acertos {hit_rate * 100:6.2f}%  epsilon {agent.epsilon:.3f}")
+            if stop_at_target and target_reached is not None:
+                break
+
+    if metrics is not None:
+        metrics.close()
+    frames = history[-1]["frames"]
+    result = {
+        "model": name or model_name(gamma, memory_size, batch_size, hidden_layers),
+        "features": features,
+        "hit_rate": history[-1]["hit_rate"],
+        "best_hit_rate": max(row["hit_rate"] for row in history),
+        "frames": frames,
+        "train_seconds": history[-1]["seconds"],
+        "frames_per_sec": history[-1]["frames_per_sec"],
+        "env_frames_per_sec": frames / env_seconds,
+        "seconds_to_target": target_reached["seconds"] if target_reached else None,
+        "frames_to_target": target_reached["frames"] if target_reached else None,
+        "history": history,
+    }
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+        result["path"] = os.path.join(output_dir, f"{result['model']}.h5")
+        agent.model.save(result["path"])
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--features", type=int, default=4, choices=[4, 6])
+    parser.add_argument("--lanes", type=int, default=16)
+    parser.add_argument("--steps", type=int, default=20000)
+    parser.add_argument("--gamma", type=float, default=0.7)
+    parser.add_argument("--memory-size", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--hidden-layers", type=int, nargs="+", default=[32, 64])
+    parser.add_argument("--epsilon-decay", type=float, default=0.999)
+    parser.add_argument("--replay-every", type=int, default=1)
+    parser.add_argument("--target-sync-every", type=int, default=None)
+    parser.add_argument("--action-repeat", type=int, default=1)
+    parser.add_argument("--eval-every", type=int, default=1000)
+    parser.add_argument("--target-hit-rate", type=float, default=0.95)
+    parser.add_argument("--stop-at-target", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output-dir", default=os.path.join(ROOT, "models-trained"))
+    parser.add_argument("--metrics", default=None, help="arquivo .csv ou .jsonl para as métricas do treino")
+    args = parser.parse_args()
+
+    result = train(args.features, args.lanes, args.steps, args.gamma, args.memory_size, args.batch_size,
+                   tuple(args.hidden_layers), args.epsilon_decay, args.replay_every, args.target_sync_every,
+                   args.action_repeat, args.eval_every, target_hit_rate=args.target_hit_rate,
+                   stop_at_target=args.stop_at_target, seed=args.seed, output_dir=args.output_dir,
+                   metrics_path=args.metrics)
+    print(f"Modelo salvo em {result['path']}")
+    print(f"{result['frames_per_sec']:.0f} frames/s no treino, {result['env_frames_per_sec']:.0f} frames/s só no ambiente")
+    if result["seconds_to_target"] is None:
+        print(f"Não chegou em {args.target_hit_rate:.0%} de acertos (melhor {result['best_hit_rate']:.2%})")
+    else:
+        print(f"{args.target_hit_rate:.0%} de acertos em {result['seconds_to_target']:.1f}s de treino "
+              f"({result['frames_to_target']} frames)")
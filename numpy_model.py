@@ -0,0 +1,54 @@
+import json
+import h5py
+import numpy as np
+
+ACTIVATIONS = {
+    "linear": lambda x: x,
+    "relu": lambda x: np.maximum(x, 0),
+    "sigmoid": lambda x: 1 / (1 + np.exp(-x)),
+    "tanh": np.tanh,
+}
+
+
+def load_dense_layers(model_path):
+    """Lê do .h5 salvo pelo Keras os pesos e ativações de cada camada Dense, em ordem."""
+    layers = []
+    with h5py.File(model_path, "r") as f:
+        config = json.loads(f.attrs["model_config"])
+        weights = f["model_weights"]
+        for layer in config["config"]["layers"]:
+            if layer["class_name"] == "InputLayer":
+                continue
+            if layer["class_name"] != "Dense":
+                raise ValueError(f"Camada não suportada: {layer['class_name']}")
+            layer_config = layer["config"]
+            group = weights[layer_config["name"]]
+            names = [name.decode() if isinstance(name, bytes) else name for name in group.attrs["weight_names"]]
+            kernel = np.asarray(group[names[0]], dtype=np.float32)
+            bias = np.asarray(group[names[1]], dtype=np.float32) if layer_config.get("use_bias", True) else None
+            layers.append((kernel, bias, layer_config["activation"]))
+    return layers
+
+
+class NumpyModel:
+    """MLP de camadas Dense rodando só com matmuls do NumPy."""
+
+    def __init__(self, layers):
+        self.layers = [(kernel, bias, ACTIVATIONS[activation]) for kernel, bias, activation in layers]
+        self.input_shape = (None, self.layers[0][0].shape[0])
+
+    @classmethod
+    def from_h5(cls, model_path):
+        return cls(load_dense_layers(model_path))
+
+    def __call__(self, x):
+        x = np.asarray(x, dtype=np.float32)
+        for kernel, bias, activation in self.layers:
+            x = x @ kernel
+            if bias is not None:
+                x += bias
+            x = activation(x)
+        return x
+
+    def predict(self, x, verbose=0):
+        return self(x)
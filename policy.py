@@ -0,0 +1,100 @@
+import time
+import numpy as np
+from numpy_model import NumpyModel
+
+
+class LatencyTracker:
+    """Guarda o tempo de cada decisão e resume em percentis."""
+
+    def __init__(self):
+        self.samples = []
+
+    def add(self, seconds):
+        self.samples.append(seconds)
+
+    def percentiles(self, points=(50, 90, 99)):
+        if not self.samples:
+            return {}
+        values = np.percentile(np.array(self.samples) * 1e6, points)
+        return {f"p{point}": value for point, value in zip(points, values)}
+
+    def summary(self):
+        stats = self.percentiles()
+        if not stats:
+            return "nenhuma decisão registrada"
+        text = "  ".join(f"{name} {value:.0f} us" for name, value in stats.items())
+        return f"{len(self.samples)} decisões  {text}"
+
+
+class KerasPolicy:
+    """Uma chamada síncrona do modelo por decisão, sem model.predict().
+
+    compiled=True passa o forward por um tf.function com assinatura fixa
+    (um estado por vez), então o grafo é traçado uma vez só; com False usa
+    model(x, training=False) direto.
+    """
+
+    def __init__(self, model_path, compiled=True):
+        # TensorFlow só é importado quando o backend Keras é de fato escolhido
+        import tensorflow as tf
+        from tensorflow.keras.models import load_model
+        from tensorflow.keras.losses import MeanSquaredError
+
+        self.model = load_model(model_path, custom_objects={'mse': MeanSquaredError()})
+        self.state_size = self.model.input_shape[-1]
+        self.latency = LatencyTracker()
+        self.last_q_values = None
+        if compiled:
+            signature = [tf.TensorSpec(shape=(1, self.state_size), dtype=tf.float32)]
+            self.forward = tf.function(lambda x: self.model(x, training=False), input_signature=signature)
+        else:
+            self.forward = lambda x: self.model(x, training=False)
+
+    def q_values(self, state):
+        state = np.asarray(state, dtype=np.float32).reshape(1, self.state_size)
+        return self.forward(state).numpy()[0]
+
+    def act(self, state):
+        start = time.perf_counter()
+        q_values = self.q_values(state)
+        action = int(np.argmax(q_values))
+        self.latency.add(time.perf_counter() - start)
+        # Guardado para quem grava a partida (recorder) não precisar rodar o modelo de novo
+        self.last_q_values = q_values
+        return action
+
+
+class NumpyPolicy(KerasPolicy):
+    """Mesma interface de KerasPolicy, mas com os pesos do .h5 rodando em NumPy, sem TensorFlow."""
+
+    def __init__(self, model_path):
+        self.model = NumpyModel.from_h5(model_path)
+        self.state_size = self.model.input_shape[-1]
+        self.latency = LatencyTracker()
+        self.last_q_values = None
+        self.forward = self.model
+
+    def q_values(self, state):
+        return self.forward(np.asarray(state).reshape(1, self.state_size))[0]
+
+
+def load_policy(model_path, backend="numpy"):
+    if backend == "numpy":
+        return NumpyPolicy(model_path)
+    if backend == "keras":
+        return KerasPolicy(model_path)
+    raise ValueError(f"Backend desconhecido: {backend}")
+
+
+def check_numpy_parity(model_paths, samples=1000):
+    """Compara as saídas do NumpyModel com as do Keras em estados aleatórios."""
+    rng = np.random.default_rng(0)
+    for model_path in model_paths:
+        keras_model = KerasPolicy(model_path, compiled=False).model
+        numpy_model = NumpyPolicy(model_path).model
+        states = rng.uniform(-1, 1, size=(samples, numpy_model.input_shape[-1])).astype(np.float32)
+        expected = np.asarray(keras_model(states, training=False))
+        got = numpy_model(states)
+        np.testing.assert_allclose(got, expected, rtol=1e-4, atol=1e-4)
+        assert (np.argmax(got, axis=1) == np.argmax(expected, axis=1)).mean() > 0.999, model_path
+    return len(model_paths)
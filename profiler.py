@@ -0,0 +1,198 @@
+import collections
+import json
+import os
+import time
+
+
+class StartupReport:
+    """Marca quanto tempo cada etapa da inicialização levou, desde o início do script."""
+
+    def __init__(self, start):
+        self.start = start
+        self.last = start
+        self.marks = []
+        self.printed = False
+
+    def mark(self, name):
+        now = time.perf_counter()
+        self.marks.append((name, now - self.last))
+        self.last = now
+
+    def summary(self):
+        parts = [f"{name} {seconds * 1000:.0f} ms" for name, seconds in self.marks]
+        parts.append(f"total {(self.last - self.start) * 1000:.0f} ms")
+        return " | ".join(parts)
+
+    def report_once(self):
+        if not self.printed:
+            self.printed = True
+            print(f"Inicialização: {self.summary()}")
+
+
+PROFILE_VARIABLE = "GAME_PROFILE"
+
+
+def bucket_index(ns):
+    # Histograma log-linear: 4 faixas por potência de 2 (erro de até ~25% no percentil)
+    if ns < 4:
+        return max(ns, 0)
+    bits = ns.bit_length()
+    return (bits - 2) * 4 + ((ns >> (bits - 3)) & 3)
+
+
+def bucket_floor(index):
+    if index < 4:
+        return index
+    return (4 | index % 4) << (index // 4 - 1)
+
+
+class PhaseHistogram:
+    __slots__ = ("count", "total", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.max = 0
+        self.buckets = [0] * 256
+
+    def add(self, ns):
+        self.count += 1
+        self.total += ns
+        if ns > self.max:
+            self.max = ns
+        self.buckets[bucket_index(ns)] += 1
+
+    def percentile(self, point):
+        wanted = self.count * point / 100
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= wanted:
+                # Meio da faixa, limitado ao maior valor visto
+                return min((bucket_floor(index) + bucket_floor(index + 1)) / 2, self.max)
+        return self.max
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "mean_us": self.total / self.count / 1e3 if self.count else 0.0,
+            "p50_us": self.percentile(50) / 1e3,
+            "p99_us": self.percentile(99) / 1e3,
+            "max_us": self.max / 1e3,
+            "total_ms": self.total / 1e6,
+        }
+
+
+class FrameProfiler:
+    """Tempo de cada fase do loop do jogo (eventos, inferência, física, desenho, flip, relógio...).
+
+    No loop: begin_frame(), lap("fase") ao fim de cada fase e end_frame().
+    Cada lap mede desde o lap anterior, então as fases somam o frame inteiro.
+    A cada report_every segundos imprime o resumo; close() imprime o final e
+    exporta para json_path (histogramas) e/ou trace_path (Chrome trace, abre
+    em chrome://tracing ou no Perfetto, com os últimos trace_events eventos).
+    """
+
+    enabled = True
+
+    def __init__(self, report_every=5.0, json_path=None, trace_path=None, trace_events=200_000, idle_phases=("relógio",)):
+        self.report_every = report_every
+        self.json_path = json_path
+        self.trace_path = trace_path
+        self.idle_phases = idle_phases
+        self.phases = {}
+        self.frame = PhaseHistogram()
+        self.events = collections.deque(maxlen=trace_events) if trace_path else None
+        self.origin = time.perf_counter_ns()
+        self.next_report = self.origin + int(report_every * 1e9) if report_every else None
+        self.frame_start = self.last = self.origin
+
+    def begin_frame(self):
+        self.frame_start = self.last = time.perf_counter_ns()
+
+    def lap(self, name):
+        now = time.perf_counter_ns()
+        histogram = self.phases.get(name)
+        if histogram is None:
+            histogram = self.phases[name] = PhaseHistogram()
+        histogram.add(now - self.last)
+        if self.events is not None:
+            self.events.append((name, self.last, now - self.last))
+        self.last = now
+
+    def end_frame(self):
+        now = time.perf_counter_ns()
+        self.frame.add(now - self.frame_start)
+        if self.events is not None:
+            self.events.append(("frame", self.frame_start, now - self.frame_start))
+        if self.next_report is not None and now >= self.next_report:
+            self.next_report = now + int(self.report_every * 1e9)
+            print(self.summary())
+
+    def busiest_phase(self):
+        busy = {name: histogram.total for name, histogram in self.phases.items() if name not in self.idle_phases}
+        return max(busy, key=busy.get) if busy else None
+
+    def summary(self):
+        frame_total = self.frame.total or 1
+        parts = [f"{name} {histogram.total / histogram.count / 1e6:.3f} ms ({histogram.total / frame_total:.0%}, "
+                 f"p99 {histogram.percentile(99) / 1e6:.3f})" for name, histogram in self.phases.items()]
+        fps = self.frame.count / (self.frame.total / 1e9) if self.frame.total else 0.0
+        return (f"Perfil {self.frame.count} frames, {fps:.0f} FPS, mais pesado: {self.busiest_phase()} | "
+                + " | ".join(parts))
+
+    def to_dict(self):
+        return {"frame": self.frame.to_dict(), "phases": {name: histogram.to_dict() for name, histogram in self.phases.items()}}
+
+    def export_json(self, path):
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def export_chrome_trace(self, path):
+        events = [{"name": name, "ph": "X", "ts": (start - self.origin) / 1e3, "dur": duration / 1e3, "pid": 0, "tid": 0}
+                  for name, start, duration in self.events]
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+    def close(self):
+        if not self.frame.count:
+            return
+        print(self.summary())
+        if self.json_path:
+            self.export_json(self.json_path)
+        if self.trace_path:
+            self.export_chrome_trace(self.trace_path)
+
+
+class NullProfiler:
+    """Mesma interface do FrameProfiler sem medir nada (perfil desligado)."""
+
+    enabled = False
+
+    def begin_frame(self):
+        pass
+
+    def lap(self, name):
+        pass
+
+    def end_frame(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def frame_profiler_from_env(environ=os.environ):
+    """GAME_PROFILE=1 liga o perfil; um caminho .json exporta os histogramas e .trace.json um Chrome trace.
+
+    GAME_PROFILE_EVERY muda o intervalo (em segundos) do resumo periódico.
+    """
+    value = environ.get(PROFILE_VARIABLE, "")
+    if value in ("", "0"):
+        return NullProfiler()
+    report_every = float(environ.get(f"{PROFILE_VARIABLE}_EVERY", 5))
+    if value.endswith(".trace.json"):
+        return FrameProfiler(report_every, trace_path=value)
+    if value.endswith(".json"):
+        return FrameProfiler(report_every, json_path=value)
+    return FrameProfiler(report_every)
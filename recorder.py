@@ -0,0 +1,138 @@
+"""Gravação de partidas em colunas .npy por blocos e leitura com memmap.
+
+Cada frame gravado tem obs (o get_state() que o agente viu), action, reward,
+done e q_values (NaN quando a decisão não veio do modelo). O recorder junta
+chunk_size frames em arrays pré-alocados e grava cada coluna do bloco num
+.npy próprio; meta.json é reescrito (atomicamente) a cada bloco, então dá
+para ler uma gravação que ainda está em andamento.
+
+    python recorder.py gravacoes/partida-1
+"""
+import argparse
+import json
+import os
+
+import numpy as np
+
+COLUMNS = ("obs", "action", "reward", "done", "q_values")
+
+
+class EpisodeRecorder:
+    def __init__(self, directory, obs_size, num_actions, chunk_size=4096, metadata=None):
+        self.directory = directory
+        self.chunk_size = chunk_size
+        self.metadata = metadata or {}
+        os.makedirs(directory, exist_ok=True)
+        self.obs = np.zeros((chunk_size, obs_size), dtype=np.float32)
+        self.action = np.zeros(chunk_size, dtype=np.int64)
+        self.reward = np.zeros(chunk_size, dtype=np.float32)
+        self.done = np.zeros(chunk_size, dtype=bool)
+        self.q_values = np.zeros((chunk_size, num_actions), dtype=np.float32)
+        self.buffers = {name: getattr(self, name) for name in COLUMNS}
+        self.cursor = 0
+        self.chunks = []
+
+    def record(self, obs, action, reward, done, q_values=None):
+        # obs pode vir no formato (1, obs_size) do get_state(); a atribuição descarta o eixo 1
+        i = self.cursor
+        self.obs[i] = obs
+        self.action[i] = action
+        self.reward[i] = reward
+        self.done[i] = done
+        self.q_values[i] = np.nan if q_values is None else q_values
+        self.cursor = i + 1
+        if self.cursor == self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        if self.cursor == 0:
+            return
+        index = len(self.chunks)
+        for name, buffer in self.buffers.items():
+            np.save(os.path.join(self.directory, f"{name}-{index:06d}.npy"), buffer[:self.cursor])
+        self.chunks.append(self.cursor)
+        self.cursor = 0
+        self.write_meta()
+
+    def write_meta(self):
+        meta = {
+            "columns": {name: {"dtype": str(buffer.dtype), "shape": list(buffer.shape[1:])}
+                        for name, buffer in self.buffers.items()},
+            "chunks": self.chunks,
+            "frames": sum(self.chunks),
+            "metadata": self.metadata,
+        }
+        path = os.path.join(self.directory, "meta.json")
+        with open(f"{path}.tmp", "w") as f:
+            json.dump(meta, f, indent=2)
+        os.replace(f"{path}.tmp", path)
+
+    def close(self):
+        self.flush()
+        if not self.chunks:
+            self.write_meta()
+
+
+class EpisodeReader:
+    """Lê uma gravação do EpisodeRecorder sem copiar: cada bloco é aberto com mmap_mode="r"."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        with open(os.path.join(directory, "meta.json")) as f:
+            self.meta = json.load(f)
+        self.metadata = self.meta["metadata"]
+        self.chunks = [
+            {name: np.load(os.path.join(directory, f"{name}-{index:06d}.npy"), mmap_mode="r") for name in COLUMNS}
+            for index in range(len(self.meta["chunks"]))
+        ]
+
+    def __len__(self):
+        return self.meta["frames"]
+
+    def column(self, name):
+        """A coluna inteira num array só (isso copia; para não copiar use self.chunks)."""
+        if not self.chunks:
+            shape = self.meta["columns"][name]["shape"]
+            return np.zeros([0] + shape, dtype=self.meta["columns"][name]["dtype"])
+        return np.concatenate([chunk[name] for chunk in self.chunks])
+
+    def episodes(self):
+        """(início, fim) de cada episódio; um episódio termina no frame com done."""
+        ends = np.flatnonzero(self.column("done")) + 1
+        starts = np.concatenate([[0], ends])
+        ends = np.concatenate([ends, [len(self)]])
+        return [(int(start), int(end)) for start, end in zip(starts, ends) if end > start]
+
+    def transitions(self):
+        """Blocos (obs, action, reward, next_obs, done) prontos para ReplayBuffer.extend.
+
+        next_obs é a obs do frame seguinte, então o último frame da gravação fica de fora.
+        """
+        for index, chunk in enumerate(self.chunks):
+            obs = chunk["obs"]
+            if index + 1 < len(self.chunks):
+                next_obs = np.concatenate([obs[1:], self.chunks[index + 1]["obs"][:1]])
+                count = len(obs)
+            else:
+                next_obs = obs[1:]
+                count = len(obs) - 1
+            if count > 0:
+                yield obs[:count], chunk["action"][:count], chunk["reward"][:count], next_obs, chunk["done"][:count]
+
+    def fill_replay(self, memory):
+        """Copia a gravação para uma memória de replay (ReplayBuffer do rocket-game ou compatível)."""
+        for states, actions, rewards, next_states, dones in self.transitions():
+            memory.extend(states, actions, rewards, next_states, dones)
+        return memory
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("directory")
+    args = parser.parse_args()
+
+    reader = EpisodeReader(args.directory)
+    rewards = reader.column("reward")
+    actions = reader.column("action")
+    print(f"{len(reader)} frames em {len(reader.chunks)} blocos, {len(reader.episodes())} episódios")
+    print(f"recompensa total {rewards.sum():.1f}  pulos {int((actions == 1).sum())}  metadados {reader.metadata}")
@@ -0,0 +1,82 @@
+import pygame
+
+
+class DirtyRenderer:
+    """Desenha o jogo atualizando na tela só os retângulos que mudaram.
+
+    A cada frame o jogo chama begin(), declara o que está na tela com rect() e
+    text() (cada item com uma chave, na ordem de desenho) e chama present().
+    O present compara com o frame anterior: apaga a posição antiga do que
+    mudou, redesenha o que cruza essas áreas e passa só elas para
+    pygame.display.update. Textos são renderizados de novo só quando o
+    conteúdo ou a cor mudam.
+    """
+
+    def __init__(self, screen, font, background=(0, 0, 0)):
+        self.screen = screen
+        self.font = font
+        self.background = background
+        self.items = {}
+        self.next_items = {}
+        self.texts = {}
+        self.first_frame = True
+
+    def begin(self):
+        self.next_items = {}
+
+    def rect(self, key, rect, color):
+        self.next_items[key] = (pygame.Rect(rect), color, None)
+
+    def text(self, key, text, position, color=(255, 255, 255)):
+        cached = self.texts.get(key)
+        if cached is None or cached[0] != text or cached[1] != color:
+            cached = (text, color, self.font.render(text, True, color))
+            self.texts[key] = cached
+        surface = cached[2]
+        self.next_items[key] = (surface.get_rect(topleft=position), color, surface)
+
+    def draw(self, item):
+        rect, color, surface = item
+        if surface is None:
+            self.screen.fill(color, rect)
+        else:
+            self.screen.blit(surface, rect)
+
+    def present(self):
+        """Mostra o frame; devolve os retângulos atualizados."""
+        if self.first_frame:
+            self.first_frame = False
+            self.screen.fill(self.background)
+            for item in self.next_items.values():
+                self.draw(item)
+            self.items = self.next_items
+            pygame.display.flip()
+            return [self.screen.get_rect()]
+
+        dirty = []
+        for key in self.items.keys() | self.next_items.keys():
+            old, new = self.items.get(key), self.next_items.get(key)
+            if not changed(old, new):
+                continue
+            # Posição antiga e nova viram um retângulo só quando se encostam (movimento de um frame)
+            if old is not None and new is not None and old[0].colliderect(new[0]):
+                dirty.append(old[0].union(new[0]))
+            else:
+                dirty.extend(item[0] for item in (old, new) if item is not None)
+        # Cada área suja é refeita inteira (fundo + itens que a cruzam, na ordem), com clip nela
+        for area in dirty:
+            self.screen.set_clip(area)
+            self.screen.fill(self.background, area)
+            for item in self.next_items.values():
+                if item[0].colliderect(area):
+                    self.draw(item)
+        self.screen.set_clip(None)
+        if dirty:
+            pygame.display.update(dirty)
+        self.items = self.next_items
+        return dirty
+
+
+def changed(old, new):
+    # Textos iguais reaproveitam a mesma Surface do cache, então basta comparar identidade
+    return old is None or new is None or old[0] != new[0] or old[1] != new[1] or old[2] is not new[2]
@@ -0,0 +1,155 @@
+"""Treino do foguete com vários actors coletando experiência e um único learner.
+
+Cada actor é um processo com seu próprio RocketEnv e uma cópia dos pesos do
+modelo (rodando em NumPy, sem TensorFlow). Os actors mandam blocos de
+transições por uma fila para o learner, que guarda tudo no ReplayBuffer do
+DQNAgent, treina e manda os pesos novos de volta a cada sync_every updates.
+Cada actor confirma os pesos que recebeu e o learner só manda a um actor
+quando a mensagem anterior foi confirmada (senão pula: a próxima já leva
+pesos mais novos), então no pipe há no máximo uma mensagem e send nunca
+bloqueia esperando um actor que está parado na fila cheia.
+
+    python actor_learner.py --actors 4 --transitions 200000
+"""
+import argparse
+import multiprocessing
+import queue
+import time
+
+import numpy as np
+
+from rocket_env import RocketEnv
+
+
+def forward(weights, states):
+    # weights vem de model.get_weights(): [kernel, bias, kernel, bias, ...], relu nas ocultas
+    x = states
+    for i in range(0, len(weights) - 2, 2):
+        x = np.maximum(x @ weights[i] + weights[i + 1], 0)
+    return x @ weights[-2] + weights[-1]
+
+
+def receive_weights(conn):
+    weights, epsilon = conn.recv()
+    conn.send(True)
+    return weights, epsilon
+
+
+def actor_process(seed, transitions, conn, stop, chunk_size):
+    # no fim do treino o que ficou na fila pode ser descartado; sem isso o processo trava ao sair
+    transitions.cancel_join_thread()
+    # seed é uma SeedSequence: um stream para a exploração e outro para os alvos do ambiente
+    policy_seed, env_seed = seed.spawn(2)
+    rng = np.random.default_rng(policy_seed)
+    env = RocketEnv(seed=env_seed)
+    weights, epsilon = receive_weights(conn)
+    state = env.reset()
+    state_size = len(state)
+
+    while not stop.is_set():
+        while conn.poll():
+            weights, epsilon = receive_weights(conn)
+
+        states = np.zeros((chunk_size, state_size), dtype=np.float32)
+        next_states = np.zeros((chunk_size, state_size), dtype=np.float32)
+        actions = np.zeros(chunk_size, dtype=np.int64)
+        rewards = np.zeros(chunk_size, dtype=np.float32)
+        dones = np.zeros(chunk_size, dtype=np.float32)
+        for i in range(chunk_size):
+            if rng.random() <= epsilon:
+                action = int(rng.integers(3))
+            else:
+                action = int(np.argmax(forward(weights, state.astype(np.float32))))
+            next_state, reward, done, _ = env.step(action)
+            states[i], actions[i], rewards[i], next_states[i], dones[i] = state, action, reward, next_state, done
+            state = env.reset() if done else next_state
+
+        while not stop.is_set():
+            try:
+                transitions.put((states, actions, rewards, next_states, dones), timeout=0.1)
+                break
+            except queue.Full:
+                # Continua lendo o pipe enquanto espera a fila
+                while conn.poll():
+                    weights, epsilon = receive_weights(conn)
+
+
+class ActorLearner:
+    def __init__(self, agent, num_actors=4, chunk_size=200, updates_per_chunk=1, sync_every=10, batch_size=32, seed=0):
+        self.agent = agent
+        self.num_actors = num_actors
+        self.chunk_size = chunk_size
+        self.updates_per_chunk = updates_per_chunk
+        self.sync_every = sync_every
+        self.batch_size = batch_size
+        self.seed = seed
+
+    def broadcast(self, connections, waiting):
+        """Manda os pesos atuais a cada actor que já confirmou a mensagem anterior."""
+        message = None
+        for i, conn in enumerate(connections):
+            while conn.poll():
+                conn.recv()
+                waiting[i] = False
+            if waiting[i]:
+                continue
+            if message is None:
+                message = (self.agent.model.get_weights(), self.agent.epsilon)
+            conn.send(message)
+            waiting[i] = True
+
+    def run(self, total_transitions):
+        # spawn: os actors não herdam o TensorFlow já inicializado no learner
+        context = multiprocessing.get_context("spawn")
+        transitions = context.Queue(maxsize=4 * self.num_actors)
+        stop = context.Event()
+        connections, actors = [], []
+        actor_seeds = np.random.SeedSequence(self.seed).spawn(self.num_actors)
+        for actor_id in range(self.num_actors):
+            learner_conn, actor_conn = context.Pipe()
+            actor = context.Process(target=actor_process, daemon=True,
+                                    args=(actor_seeds[actor_id], transitions, actor_conn, stop, self.chunk_size))
+            actor.start()
+            connections.append(learner_conn)
+            actors.append(actor)
+        waiting = [False] * self.num_actors
+        self.broadcast(connections, waiting)
+
+        received = updates = 0
+        start = time.perf_counter()
+        try:
+            while received < total_transitions:
+                chunk = transitions.get()
+                self.agent.memory.extend(*chunk)
+                received += len(chunk[1])
+                for _ in range(self.updates_per_chunk):
+                    self.agent.replay(self.batch_size)
+                    updates += 1
+                    if updates % self.sync_every == 0:
+                        self.broadcast(connections, waiting)
+        finally:
+            elapsed = time.perf_counter() - start
+            stop.set()
+            for actor in actors:
+                actor.join(timeout=5)
+                if actor.is_alive():
+                    actor.terminate()
+        return {"transitions": received, "updates": updates, "seconds": elapsed,
+                "transitions_per_sec": received / elapsed}
+
+
+if __name__ == "__main__":
+    from dqn_agent import DQNAgent
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--actors", type=int, default=multiprocessing.cpu_count())
+    parser.add_argument("--transitions", type=int, default=200_000)
+    parser.add_argument("--chunk-size", type=int, default=200)
+    parser.add_argument("--updates-per-chunk", type=int, default=1)
+    parser.add_argument("--sync-every", type=int, default=10)
+    args = parser.parse_args()
+
+    agent = DQNAgent(epsilon_decay=0.99, fit_epochs=1)
+    stats = ActorLearner(agent, args.actors, args.chunk_size, args.updates_per_chunk, args.sync_every).run(args.transitions)
+    print(f"{stats['transitions']} transições, {stats['updates']} updates, {stats['transitions_per_sec']:.0f} transições/s")
+    agent.save_model()
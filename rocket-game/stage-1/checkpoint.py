@@ -0,0 +1,151 @@
+import glob
+import json
+import os
+import queue
+import threading
+import time
+
+import numpy as np
+
+
+def optimizer_variables(optimizer):
+    variables = optimizer.variables
+    return variables() if callable(variables) else variables
+
+
+def snapshot_agent(agent, step):
+    """Cópia em memória de tudo que é preciso para retomar o treino."""
+    arrays = {f"weights_{i}": w for i, w in enumerate(agent.model.get_weights())}
+    arrays.update({f"optimizer_{i}": np.array(v) for i, v in enumerate(optimizer_variables(agent.model.optimizer))})
+    if agent.target_model is not None:
+        arrays.update({f"target_{i}": w for i, w in enumerate(agent.target_model.get_weights())})
+    meta = {"step": step, "epsilon": agent.epsilon, "replay_steps": agent.replay_steps, "model_name": agent.model_name}
+    arrays["meta"] = np.array(json.dumps(meta))
+    return arrays
+
+
+def load_checkpoint(path):
+    with np.load(path) as data:
+        arrays = {key: data[key] for key in data.files}
+    meta = json.loads(str(arrays.pop("meta")))
+
+    def collect(prefix):
+        keys = sorted((key for key in arrays if key.startswith(prefix)), key=lambda key: int(key.rsplit("_", 1)[1]))
+        return [arrays[key] for key in keys]
+
+    return {"meta": meta, "weights": collect("weights_"), "optimizer": collect("optimizer_"), "target": collect("target_")}
+
+
+def restore_agent(agent, checkpoint):
+    agent.model.set_weights(checkpoint["weights"])
+    optimizer = agent.model.optimizer
+    if checkpoint["optimizer"]:
+        if not optimizer.built:
+            optimizer.build(agent.model.trainable_variables)
+        for variable, value in zip(optimizer_variables(optimizer), checkpoint["optimizer"]):
+            variable.assign(value)
+    if agent.target_model is not None:
+        agent.target_model.set_weights(checkpoint["target"] or checkpoint["weights"])
+    agent.epsilon = checkpoint["meta"]["epsilon"]
+    agent.replay_steps = checkpoint["meta"]["replay_steps"]
+    return checkpoint["meta"]["step"]
+
+
+class CheckpointWriter:
+    """Grava checkpoints numa thread separada, fora do loop de treino.
+
+    save() só tira um snapshot dos pesos em memória; a thread escreve num
+    arquivo temporário e faz os.replace (atômico), mantendo os últimos keep
+    arquivos. Se a escrita anterior ainda não terminou, o snapshot pendente
+    é trocado pelo mais novo em vez de enfileirar. Quando a memória de replay
+    está em memmap, a mesma thread faz o flush dela antes de gravar. Com
+    metrics (um MetricsLogger), o tempo parado em cada save() e o passo
+    retomado vão para as métricas do treino. Uma escrita que falha (disco
+    cheio, por exemplo) não derruba a thread: o erro fica em errors (e nas
+    métricas), o .tmp é apagado e o próximo save() tenta de novo.
+    """
+
+    def __init__(self, directory, prefix, keep=3, metrics=None):
+        self.directory = directory
+        self.prefix = prefix
+        self.keep = keep
+        self.metrics = metrics
+        self.stall_times = []
+        self.errors = []
+        os.makedirs(directory, exist_ok=True)
+        self.pending = queue.Queue(maxsize=1)
+        self.thread = threading.Thread(target=self.write_loop, daemon=True)
+        self.thread.start()
+
+    def checkpoints(self):
+        # Só o passo depois do prefixo: "x-fit-*" também pegaria os arquivos de "x-fit-graph"
+        return sorted(glob.glob(os.path.join(self.directory, f"{self.prefix}-{'[0-9]' * 9}.npz")))
+
+    def latest(self):
+        checkpoints = self.checkpoints()
+        return checkpoints[-1] if checkpoints else None
+
+    def restore_latest(self, agent):
+        """Restaura o checkpoint mais recente; devolve o passo salvo (0 se não houver)."""
+        path = self.latest()
+        if path is None:
+            return 0
+        step = restore_agent(agent, load_checkpoint(path))
+        if self.metrics is not None:
+            self.metrics.log(resumed_step=step, resumed_epsilon=agent.epsilon)
+        return step
+
+    def save(self, agent, step):
+        start = time.perf_counter()
+        arrays = snapshot_agent(agent, step)
+        try:
+            self.pending.get_nowait()
+        except queue.Empty:
+            pass
+        self.pending.put((step, arrays, agent.memory.flush))
+        stall = time.perf_counter() - start
+        self.stall_times.append(stall)
+        if self.metrics is not None:
+            self.metrics.log(checkpoint_stall_ms=stall * 1000)
+
+    def write_loop(self):
+        while True:
+            job = self.pending.get()
+            if job is None:
+                break
+            step, arrays, flush_memory = job
+            path = os.path.join(self.directory, f"{self.prefix}-{step:09d}.npz")
+            temp_path = f"{path}.tmp"
+            try:
+                flush_memory()
+                with open(temp_path, "wb") as f:
+                    np.savez(f, **arrays)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, path)
+                for old in self.checkpoints()[:-self.keep]:
+                    os.remove(old)
+            except Exception as error:
+                self.report_error(step, error)
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+
+    def report_error(self, step, error):
+        message = f"{type(error).__name__}: {error}"
+        self.errors.append((step, message))
+        if self.metrics is not None:
+            self.metrics.log(checkpoint_error=message, checkpoint_error_step=step)
+        else:
+            print(f"Checkpoint {step} falhou: {message}")
+
+    def close(self):
+        # Se a thread morreu, ninguém mais esvazia a fila e um put bloqueante travaria aqui
+        while self.thread.is_alive():
+            try:
+                self.pending.put(None, timeout=0.1)
+                break
+            except queue.Full:
+                pass
+        self.thread.join()
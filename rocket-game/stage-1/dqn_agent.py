@@ -0,0 +1,160 @@
+import time
+import numpy as np
+from tensorflow.keras.models import Sequential, clone_model
+from tensorflow.keras.layers import Dense
+import os
+from replay_memory import ReplayBuffer, PrioritizedReplayBuffer
+
+
+class DQNAgent:
+    def __init__(self, state_size=7, action_size=3, hidden_layers=(32, 32, 64), gamma=0.95,
+                 memory_size=2000, epsilon_decay=0.999, fit_epochs=3, batched_replay=True,
+                 target_sync_every=None, tau=None, double_dqn=False, prioritized_replay=False,
+                 memory_path=None, seed=None, metrics=None):
+        self.state_size = state_size
+        self.action_size = action_size
+        # Exploração e amostragem da memória com Generators próprios, filhos de seed (int ou SeedSequence)
+        if not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+        act_seed, memory_seed = seed.spawn(2)
+        self.rng = np.random.default_rng(act_seed)
+        self.model = Sequential(
+            [Dense(hidden_layers[0], activation='relu', input_shape=(state_size,))]
+            + [Dense(units, activation='relu') for units in hidden_layers[1:]]
+            + [Dense(action_size, activation='linear')]
+        )
+        self.model.compile(optimizer='adam', loss='mse')
+        if prioritized_replay and not batched_replay:
+            raise ValueError("prioritized_replay precisa do batched_replay")
+        self.prioritized_replay = prioritized_replay
+        if prioritized_replay:
+            self.memory = PrioritizedReplayBuffer(memory_size, state_size, path=memory_path,
+                                                  rng=np.random.default_rng(memory_seed))
+        else:
+            # Com memory_path a memória fica em disco (memmap) e sobrevive a reinícios do treino
+            self.memory = ReplayBuffer(memory_size, state_size, path=memory_path, rng=np.random.default_rng(memory_seed))
+        self.epsilon = 1.0
+        self.epsilon_min = 0.01
+        self.epsilon_decay = epsilon_decay
+        self.gamma = gamma
+        # fit_epochs só vale para o replay antigo (uma amostra por vez)
+        self.fit_epochs = fit_epochs
+        self.batched_replay = batched_replay
+
+        # Target network congelada: cópia "hard" a cada target_sync_every replays ou Polyak com tau
+        if double_dqn and not (target_sync_every or tau):
+            raise ValueError("double_dqn precisa de target network (target_sync_every ou tau)")
+        self.target_sync_every = target_sync_every
+        self.tau = tau
+        self.double_dqn = double_dqn
+        self.target_model = None
+        if target_sync_every or tau:
+            self.target_model = clone_model(self.model)
+            self.target_model.set_weights(self.model.get_weights())
+        self.replay_steps = 0
+        # Com um MetricsLogger cada replay registra latência, loss, Q médio e epsilon
+        self.metrics = metrics
+        self.updates = 0
+        self.last_loss = None
+        self.last_mean_q = None
+        layers_name = "-".join(str(units) for units in hidden_layers)
+        self.model_name = f"rocket-model-gm--{self.gamma}-mem--{self.memory.capacity}--{layers_name}"
+
+    def remember(self, state, action, reward, next_state, done):
+        self.memory.append(state, action, reward, next_state, done)
+
+    def act(self, state):
+        if self.rng.random() <= self.epsilon:
+            return int(self.rng.integers(self.action_size))
+        q_values = self.model.predict(np.array([state]), verbose=0)
+        return np.argmax(q_values[0])
+
+    def act_batch(self, states):
+        """Epsilon-greedy para vários estados com um único forward pass."""
+        actions = np.argmax(np.asarray(self.model.predict_on_batch(np.asarray(states, dtype=np.float32))), axis=1)
+        explore = self.rng.random(len(actions)) <= self.epsilon
+        actions[explore] = self.rng.integers(0, self.action_size, size=int(explore.sum()))
+        return actions
+
+    def replay(self, batch_size=32):
+        if len(self.memory) < batch_size:
+            return
+        start = time.perf_counter()
+        if self.prioritized_replay:
+            indices, weights = self.memory.sample_prioritized(batch_size)
+            td_errors = self.replay_batched(*self.memory.get(indices), sample_weights=weights)
+            self.memory.update_priorities(indices, td_errors)
+        elif self.batched_replay:
+            self.replay_batched(*self.memory.sample(batch_size))
+        else:
+            self.replay_per_sample(*self.memory.sample(batch_size))
+        self.update_target_model()
+        if self.epsilon > self.epsilon_min:
+            self.epsilon *= self.epsilon_decay
+        self.updates += 1
+        if self.metrics is not None:
+            self.metrics.log(replay_ms=(time.perf_counter() - start) * 1000, loss=self.last_loss,
+                             mean_q=self.last_mean_q, epsilon=self.epsilon)
+
+    def replay_per_sample(self, states, actions, rewards, next_states, dones):
+        losses, q_values = [], []
+        for state, action, reward, next_state, done in zip(states, actions, rewards, next_states, dones):
+            target = reward
+            if not done:
+                bootstrap_model = self.model if self.target_model is None else self.target_model
+                q_next = bootstrap_model.predict(np.array([next_state]), verbose=0)[0]
+                if self.double_dqn:
+                    # Double DQN: a rede online escolhe a ação, a target avalia
+                    q_next = q_next[np.argmax(self.model.predict(np.array([next_state]), verbose=0)[0])]
+                target += self.gamma * np.amax(q_next)
+            target_f = self.model.predict(np.array([state]), verbose=0)
+            q_values.append(target_f.mean())
+            target_f[0][action] = target
+            history = self.model.fit(np.array([state]), target_f, epochs=self.fit_epochs, verbose=0)
+            losses.append(history.history["loss"][-1])
+        self.last_loss = float(np.mean(losses))
+        self.last_mean_q = float(np.mean(q_values))
+
+    def replay_batched(self, states, actions, rewards, next_states, dones, sample_weights=None):
+        """Um passo de gradiente no minibatch inteiro; devolve os TD errors (usados pelo PER)."""
+        batch_size = len(states)
+        if self.target_model is None or self.double_dqn:
+            # Um único forward pass da rede online para states e next_states juntos
+            q_values = np.array(self.model.predict_on_batch(np.concatenate([states, next_states])))
+            target_f, q_next = q_values[:batch_size], q_values[batch_size:]
+        else:
+            target_f = np.array(self.model.predict_on_batch(states))
+        if self.target_model is not None:
+            q_next_target = np.asarray(self.target_model.predict_on_batch(next_states))
+            if self.double_dqn:
+                # Double DQN: a rede online escolhe a ação, a target avalia
+                next_values = q_next_target[np.arange(batch_size), np.argmax(q_next, axis=1)]
+            else:
+                next_values = np.amax(q_next_target, axis=1)
+        else:
+            next_values = np.amax(q_next, axis=1)
+        self.last_mean_q = float(target_f.mean())
+        targets = rewards + self.gamma * next_values * (1.0 - dones)
+        td_errors = targets - target_f[np.arange(batch_size), actions]
+        target_f[np.arange(batch_size), actions] = targets
+        self.last_loss = float(self.model.train_on_batch(states, target_f, sample_weight=sample_weights))
+        return td_errors
+
+    def update_target_model(self):
+        if self.target_model is None:
+            return
+        self.replay_steps += 1
+        if self.tau:
+            self.target_model.set_weights([
+                self.tau * weights + (1 - self.tau) * target_weights
+                for weights, target_weights in zip(self.model.get_weights(), self.target_model.get_weights())
+            ])
+        elif self.replay_steps % self.target_sync_every == 0:
+            self.target_model.set_weights(self.model.get_weights())
+
+    def save_model(self, directory=None):
+        # Sem directory o .h5 vai para a pasta do rocket-game, ao lado deste arquivo
+        directory = directory or os.path.abspath(os.path.dirname(__file__))
+        path = os.path.join(directory, f"{self.model_name}.h5")
+        self.model.save(path)
+        return path
@@ -0,0 +1,80 @@
+import csv
+import json
+import os
+import threading
+import time
+
+
+class MetricsLogger:
+    """Métricas de treino gravadas em lote por uma thread, fora do loop de treino.
+
+    log(**values) só guarda (passo, horário, valores) numa lista; a cada
+    flush_every segundos a thread grava o que acumulou. O passo é o atributo
+    step, que o trainer avança (passos de ambiente), então o que o DQNAgent
+    registra no replay cai no passo em que aconteceu. Com .jsonl cada log()
+    vira uma linha; com .csv cada métrica vira uma linha (step, time, name,
+    value), já que cada log() pode trazer métricas diferentes. O arquivo é
+    aberto em modo append para continuar depois de retomar um checkpoint.
+    """
+
+    def __init__(self, path, flush_every=1.0):
+        self.path = path
+        self.flush_every = flush_every
+        self.step = 0
+        self.format = "csv" if path.endswith(".csv") else "jsonl"
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        self.file = open(path, "a", newline="")
+        if self.format == "csv":
+            self.writer = csv.writer(self.file)
+            if new_file:
+                self.writer.writerow(["step", "time", "name", "value"])
+        self.rows = []
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.write_loop, daemon=True)
+        self.thread.start()
+
+    def log(self, **values):
+        row = (self.step, time.time(), values)
+        with self.lock:
+            self.rows.append(row)
+
+    def write_loop(self):
+        while not self.stopped.wait(self.flush_every):
+            self.flush()
+
+    def flush(self):
+        with self.lock:
+            rows, self.rows = self.rows, []
+        if not rows:
+            return
+        if self.format == "csv":
+            self.writer.writerows((step, f"{moment:.3f}", name, value)
+                                  for step, moment, values in rows for name, value in values.items())
+        else:
+            self.file.writelines(json.dumps(dict(step=step, time=round(moment, 3), **values), default=float) + "\n"
+                                 for step, moment, values in rows)
+        self.file.flush()
+
+    def close(self):
+        self.stopped.set()
+        self.thread.join()
+        self.flush()
+        self.file.close()
+
+
+class Throughput:
+    """Taxa (ex.: passos de ambiente por segundo) desde a leitura anterior."""
+
+    def __init__(self, count=0):
+        self.last_count = count
+        self.last_time = time.perf_counter()
+
+    def per_sec(self, count):
+        now = time.perf_counter()
+        rate = (count - self.last_count) / (now - self.last_time) if now > self.last_time else 0.0
+        self.last_count, self.last_time = count, now
+        return rate
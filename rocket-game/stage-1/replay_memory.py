@@ -0,0 +1,190 @@
+import os
+import numpy as np
+
+
+class ReplayBuffer:
+    """Memória de replay em ring buffer com arrays NumPy pré-alocados.
+
+    Cada coluna (states, actions, rewards, next_states, dones) é um array
+    contíguo, então append é O(1) e sample devolve o batch pronto para o
+    treino, sem empilhar tuplas.
+
+    Com path, cada coluna (e o cursor de escrita) vira um .npy aberto com
+    memmap nessa pasta: reabrir a mesma pasta retoma a memória de onde parou,
+    sem carregar tudo na RAM.
+    """
+
+    def __init__(self, capacity, state_size, path=None, rng=None):
+        self.capacity = capacity
+        self.state_size = state_size
+        self.path = path
+        self.rng = rng if rng is not None else np.random.default_rng()
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+        self.states = self.open_array("states", (capacity, state_size), np.float32)
+        self.next_states = self.open_array("next_states", (capacity, state_size), np.float32)
+        self.actions = self.open_array("actions", (capacity,), np.int64)
+        self.rewards = self.open_array("rewards", (capacity,), np.float32)
+        self.dones = self.open_array("dones", (capacity,), np.float32)
+        self.counters = self.open_array("counters", (2,), np.int64)
+        self.cursor, self.size = (int(value) for value in self.counters)
+
+    def open_array(self, name, shape, dtype):
+        if self.path is None:
+            return np.zeros(shape, dtype=dtype)
+        filename = os.path.join(self.path, f"{name}.npy")
+        if not os.path.exists(filename):
+            return np.lib.format.open_memmap(filename, mode="w+", dtype=dtype, shape=shape)
+        array = np.lib.format.open_memmap(filename, mode="r+")
+        if array.shape != shape or array.dtype != dtype:
+            raise ValueError(f"{filename} tem shape {array.shape}/{array.dtype}, esperado {shape}/{np.dtype(dtype)}")
+        return array
+
+    def flush(self):
+        for array in (self.states, self.next_states, self.actions, self.rewards, self.dones, self.counters):
+            if isinstance(array, np.memmap):
+                array.flush()
+
+    def __len__(self):
+        return self.size
+
+    def append(self, state, action, reward, next_state, done):
+        i = self.cursor
+        self.states[i] = state
+        self.actions[i] = action
+        self.rewards[i] = reward
+        self.next_states[i] = next_state
+        self.dones[i] = done
+        self.cursor = (i + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+        self.counters[0], self.counters[1] = self.cursor, self.size
+
+    def extend(self, states, actions, rewards, next_states, dones):
+        """Insere um bloco de transições de uma vez (ex.: vindo de um actor)."""
+        count = len(actions)
+        indices = (self.cursor + np.arange(count)) % self.capacity
+        self.states[indices] = states
+        self.actions[indices] = actions
+        self.rewards[indices] = rewards
+        self.next_states[indices] = next_states
+        self.dones[indices] = dones
+        self.cursor = (self.cursor + count) % self.capacity
+        self.size = min(self.size + count, self.capacity)
+        self.counters[0], self.counters[1] = self.cursor, self.size
+
+    def sample_indices(self, batch_size):
+        return self.rng.integers(0, self.size, size=batch_size)
+
+    def get(self, indices):
+        return (
+            self.states[indices],
+            self.actions[indices],
+            self.rewards[indices],
+            self.next_states[indices],
+            self.dones[indices],
+        )
+
+    def sample(self, batch_size):
+        return self.get(self.sample_indices(batch_size))
+
+
+class SumTree:
+    """Sum-tree em um único array: folhas em [capacity, 2 * capacity), raiz no índice 1.
+
+    update e find trabalham com vários índices/valores de uma vez, descendo ou
+    subindo um nível da árvore por operação vetorizada (O(log n) níveis).
+    """
+
+    def __init__(self, capacity, tree=None):
+        self.capacity = 1
+        while self.capacity < capacity:
+            self.capacity *= 2
+        self.depth = self.capacity.bit_length() - 1
+        self.tree = np.zeros(2 * self.capacity, dtype=np.float64) if tree is None else tree
+
+    def total(self):
+        return self.tree[1]
+
+    def update(self, indices, priorities):
+        nodes = np.asarray(indices) + self.capacity
+        self.tree[nodes] = priorities
+        for _ in range(self.depth):
+            nodes = np.unique(nodes // 2)
+            self.tree[nodes] = self.tree[2 * nodes] + self.tree[2 * nodes + 1]
+
+    def find(self, values):
+        """Índice da folha onde cai cada valor da soma acumulada."""
+        nodes = np.ones(len(values), dtype=np.int64)
+        values = np.array(values, dtype=np.float64)
+        for _ in range(self.depth):
+            left = 2 * nodes
+            go_right = values >= self.tree[left]
+            values -= self.tree[left] * go_right
+            nodes = left + go_right
+        return nodes - self.capacity
+
+    def get(self, indices):
+        return self.tree[np.asarray(indices) + self.capacity]
+
+
+class PrioritizedReplayBuffer(ReplayBuffer):
+    """ReplayBuffer com amostragem proporcional à prioridade (PER).
+
+    Transições novas entram com a maior prioridade vista até agora. sample_prioritized
+    devolve os índices e os pesos de importance sampling; depois do treino,
+    update_priorities recebe os TD errors do batch inteiro de uma vez.
+    """
+
+    def __init__(self, capacity, state_size, alpha=0.6, beta=0.4, beta_increment=0.0001, epsilon=1e-6, path=None,
+                 rng=None):
+        super().__init__(capacity, state_size, path, rng)
+        self.tree = SumTree(capacity)
+        if path is not None:
+            self.tree = SumTree(capacity, self.open_array("priorities", (2 * self.tree.capacity,), np.float64))
+        self.alpha = alpha
+        self.beta_increment = beta_increment
+        self.epsilon = epsilon
+        # max_priority e beta também persistem com a memória
+        self.per_state = self.open_array("per_state", (2,), np.float64)
+        if self.size == 0:
+            self.per_state[:] = (1.0, beta)
+        self.max_priority, self.beta = (float(value) for value in self.per_state)
+
+    def flush(self):
+        super().flush()
+        for array in (self.tree.tree, self.per_state):
+            if isinstance(array, np.memmap):
+                array.flush()
+
+    def append(self, state, action, reward, next_state, done):
+        index = self.cursor
+        super().append(state, action, reward, next_state, done)
+        self.tree.update([index], self.max_priority ** self.alpha)
+
+    def extend(self, states, actions, rewards, next_states, dones):
+        indices = (self.cursor + np.arange(len(actions))) % self.capacity
+        super().extend(states, actions, rewards, next_states, dones)
+        self.tree.update(indices, self.max_priority ** self.alpha)
+
+    def sample_prioritized(self, batch_size):
+        # Amostragem estratificada: um valor uniforme em cada fatia da soma total
+        total = self.tree.total()
+        segment = total / batch_size
+        values = (np.arange(batch_size) + self.rng.random(batch_size)) * segment
+        indices = np.minimum(self.tree.find(np.minimum(values, total * (1 - 1e-12))), self.size - 1)
+
+        self.beta = min(1.0, self.beta + self.beta_increment)
+        self.per_state[1] = self.beta
+        probabilities = self.tree.get(indices) / total
+        weights = (self.size * probabilities) ** -self.beta
+        return indices, (weights / weights.max()).astype(np.float32)
+
+    def sample(self, batch_size):
+        indices, _ = self.sample_prioritized(batch_size)
+        return self.get(indices)
+
+    def update_priorities(self, indices, td_errors):
+        priorities = np.abs(td_errors) + self.epsilon
+        self.max_priority = max(self.max_priority, float(priorities.max()))
+        self.per_state[0] = self.max_priority
+        self.tree.update(indices, priorities ** self.alpha)
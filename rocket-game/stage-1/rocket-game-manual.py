@@ -1,5 +1,11 @@
+import os
+import sys
 import pygame
 import random
+from rocket_env import RotationCache
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from profiler import frame_profiler_from_env
 
 class Target:
     def __init__(self, x, y, width, height):
@@ -25,6 +31,7 @@ class Rocket:
         self.image = self.original_image
 
         self.rocket_rect = self.image.get_rect(center=(self.x + self.width // 2, self.y + self.height // 2))
+        self.sprites = RotationCache({"idle": self.original_image})
         
         self.DEFAULT_SPEED = 1
         self.SPEED_UP = 1.02
@@ -155,7 +162,7 @@ class Rocket:
         self.rocket_rect.center = (self.x + self.width // 2, self.y + self.height // 2)
 
     def draw(self, screen):
-        rotated_image = pygame.transform.rotate(self.original_image, -self.noise_angle)
+        rotated_image = self.sprites.get("idle", -self.noise_angle)
         new_rect = rotated_image.get_rect(center=self.rocket_rect.center)
         screen.blit(rotated_image, new_rect.topleft)
 
@@ -168,6 +175,8 @@ class Game:
         self.WHITE = (255, 255, 255)
         self.BLACK = (0, 0, 0)
         self.clock = pygame.time.Clock()
+        # GAME_PROFILE=1 (ou um caminho .json / .trace.json) mede cada fase do frame
+        self.profiler = frame_profiler_from_env()
         self.FPS = 60
         self.running = True
 
@@ -184,23 +193,32 @@ class Game:
     def run(self):
         try:
             while self.running:
+                self.profiler.begin_frame()
                 for event in pygame.event.get():
                     if event.type == pygame.QUIT:
                         self.running = False
                     else:
                         self.rocket.handle_input(event)
+                self.profiler.lap("eventos")
 
                 self.rocket.update(self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
+                self.profiler.lap("física")
 
                 self.screen.fill(self.BLACK)
                 self.rocket.draw(self.screen)
                 self.target.draw(self.screen)
+                self.profiler.lap("desenho")
                 print(f"Distancia: {self.target.calculate_distance_to_rocket(self.rocket.rocket_rect)}")
+                self.profiler.lap("distância")
                 pygame.display.update()
+                self.profiler.lap("apresentar")
                 self.clock.tick(self.FPS)
+                self.profiler.lap("relógio")
+                self.profiler.end_frame()
         except Exception as e:
             print(f"Ocorreu um erro: {e}")
         finally:
+            self.profiler.close()
             pygame.quit()
 
 if __name__ == "__main__":
@@ -0,0 +1,505 @@
+import os
+from collections import OrderedDict
+
+import numpy as np
+import pygame
+
+SPRITES_DIR = os.path.abspath(os.path.dirname(__file__))
+
+
+class RotationCache:
+    """Sprites rotacionados guardados por ângulo quantizado.
+
+    noise_angle anda em passos de 0.2/0.3 dentro de ±35°, então com
+    resolution=0.1 são no máximo 701 ângulos por sprite. Cada rotação é feita
+    na primeira vez que o ângulo aparece (ou todas de uma vez com warm) e as
+    menos usadas saem quando o cache passa de max_size.
+    """
+
+    def __init__(self, sprites, resolution=0.1, max_size=2048):
+        self.sprites = sprites
+        self.resolution = resolution
+        self.max_size = max_size
+        self.rotated = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, name):
+        return name in self.sprites
+
+    def __len__(self):
+        return len(self.rotated)
+
+    def get(self, name, angle):
+        key = (name, round(angle / self.resolution))
+        image = self.rotated.get(key)
+        if image is not None:
+            self.hits += 1
+            self.rotated.move_to_end(key)
+            return image
+        self.misses += 1
+        image = pygame.transform.rotate(self.sprites[name], key[1] * self.resolution)
+        self.rotated[key] = image
+        if len(self.rotated) > self.max_size:
+            self.rotated.popitem(last=False)
+        return image
+
+    def warm(self, angle_limit=35):
+        steps = round(angle_limit / self.resolution)
+        for name in self.sprites:
+            for step in range(-steps, steps + 1):
+                self.get(name, step * self.resolution)
+
+
+def load_rocket_sprites(height=47, directory=SPRITES_DIR, **cache_options):
+    """rocket.png e rocket-thrusted.png reduzidos para a altura do foguete, num RotationCache."""
+    sprites = {}
+    for name, filename in (("idle", "rocket.png"), ("thrusted", "rocket-thrusted.png")):
+        image = pygame.image.load(os.path.join(directory, filename))
+        if pygame.display.get_surface() is not None:
+            image = image.convert_alpha()
+        width = max(1, round(image.get_width() * height / image.get_height()))
+        sprites[name] = pygame.transform.smoothscale(image, (width, height))
+    return RotationCache(sprites, **cache_options)
+
+
+class Target:
+    __slots__ = ("rect", "color")
+
+    def __init__(self, x, y, width, height):
+        self.rect = pygame.Rect(x, y, width, height)
+        self.color = (0, 255, 0) 
+
+    def draw(self, screen):
+        pygame.draw.rect(screen, self.color, self.rect)
+        
+    def calculate_distance_to_rocket(self, rocket_rect):
+        return abs(self.rect.centerx - rocket_rect.centerx) + abs(self.rect.centery - rocket_rect.centery)
+        
+
+class Rocket:
+    __slots__ = ("width", "height", "x", "y", "original_image", "image", "rocket_rect", "sprites", "speed",
+                 "started_thrust_on_down", "win_gravity_down", "request_deceleration", "start_deceleration",
+                 "move_left", "move_right", "thrust", "started_thrust", "noise_angle")
+
+    DEFAULT_SPEED = 1
+    SPEED_UP = 1.02
+    GRAVITY_DOWN = 1.05
+    MAX_SPEED = 5
+    GRAVITY_DESACELARATION = 0.965
+    MAX_GRAVITY_DOWN_SPEED = 2.3
+
+    def __init__(self, x, y, width, height, sprites=None):
+        self.width = width
+        self.height = height
+        self.x = x
+        self.y = y
+
+        self.original_image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        self.original_image.fill((255, 0, 0)) 
+        self.image = self.original_image
+
+        self.rocket_rect = self.image.get_rect(center=(self.x + self.width // 2, self.y + self.height // 2))
+        # Rotações em cache por ângulo; sem sprites (RotationCache) desenha o retângulo vermelho
+        self.sprites = sprites if sprites is not None else RotationCache({"idle": self.original_image})
+        
+        self.speed = 0.7
+        self.started_thrust_on_down = False
+        self.win_gravity_down = False
+        self.request_deceleration = False
+        self.start_deceleration = False
+        self.move_left = False
+        self.move_right = False
+        self.thrust = False
+        self.started_thrust = False
+        self.noise_angle = 0 
+
+    def handle_input(self, action):
+            if action == 0:
+                self.thrust = not self.thrust
+                self.move_right = False
+                self.move_left = False
+            if action == 1:
+                self.move_left = True
+                self.move_right = False
+            if action == 2:
+                self.move_right = True
+                self.move_left = False
+
+    def handle_gravity_down(self, screen_height):
+        if self.y < (screen_height - self.height) and not self.thrust and not self.started_thrust_on_down and not self.request_deceleration:
+            if not self.start_deceleration:
+                self.request_deceleration = True
+            else:
+                self.win_gravity_down = False
+                self.started_thrust = False
+                self.y += self.speed
+                if self.speed < self.MAX_SPEED:
+                    self.speed *= self.GRAVITY_DOWN
+
+    def handle_thrust(self):
+        if self.thrust and not self.started_thrust_on_down:
+            if not self.win_gravity_down:
+                self.request_deceleration = False
+                self.start_deceleration = False
+                self.started_thrust_on_down = True
+            self.started_thrust = True
+            self.y -= self.speed
+            if self.speed < self.MAX_SPEED:
+                self.speed *= self.SPEED_UP
+
+    def handle_deceleration(self):
+        if self.request_deceleration:
+            if self.speed > self.DEFAULT_SPEED:
+                self.speed *= self.GRAVITY_DESACELARATION
+                self.y -= self.speed
+            else:
+                self.request_deceleration = False
+                self.start_deceleration = True
+
+    def handle_thrust_on_down(self):
+        if self.started_thrust_on_down:
+            if self.speed > self.DEFAULT_SPEED:
+                self.speed *= self.GRAVITY_DESACELARATION
+                self.y += self.speed
+            else:
+                self.started_thrust_on_down = False
+                self.win_gravity_down = True
+
+    def handle_horizontal_movement(self):
+        angle_limit = 35
+        if self.move_left:
+            self.noise_angle -= 0.3
+            if self.noise_angle < -angle_limit:
+                self.noise_angle = -angle_limit 
+            
+        elif self.move_right:
+            self.noise_angle += 0.3
+            if self.noise_angle > angle_limit:
+                self.noise_angle = angle_limit 
+                
+        if self.noise_angle > 0:
+            self.x += (abs(self.noise_angle) / self.MAX_SPEED) 
+        elif self.noise_angle < 0:
+            self.x -= (abs(self.noise_angle) / self.MAX_SPEED)     
+             
+        if not self.move_left and not self.move_right:
+            if self.noise_angle > 0:
+                self.noise_angle -= 0.2
+                if self.noise_angle < 0:
+                    self.noise_angle = 0
+            elif self.noise_angle < 0:
+                self.noise_angle += 0.2
+                if self.noise_angle > 0:
+                    self.noise_angle = 0
+
+    def handle_boundary_conditions(self, screen_width, screen_height):
+        if self.x < 0:
+            self.x = 0
+        elif self.x > screen_width - self.width:
+            self.x = screen_width - self.width
+        if self.y < 0:
+            self.y = 0
+        elif self.y > screen_height - self.height:
+            self.y = screen_height - self.height
+
+    def reset_speed_on_ground(self, screen_height):
+        if self.y == (screen_height - self.height):
+            self.speed = self.DEFAULT_SPEED
+            self.started_thrust_on_down = False
+            self.win_gravity_down = False
+            self.request_deceleration = False
+
+    def update(self, screen_width, screen_height):
+        self.reset_speed_on_ground(screen_height)
+        self.handle_deceleration()
+        self.handle_gravity_down(screen_height)
+        self.handle_thrust_on_down()
+        self.handle_thrust()
+        self.handle_horizontal_movement()
+        self.handle_boundary_conditions(screen_width, screen_height)
+
+        self.rocket_rect.center = (self.x + self.width // 2, self.y + self.height // 2)
+
+    def draw(self, screen):
+        sprite = "thrusted" if self.thrust and "thrusted" in self.sprites else "idle"
+        rotated_image = self.sprites.get(sprite, -self.noise_angle)
+        new_rect = rotated_image.get_rect(center=self.rocket_rect.center)
+        screen.blit(rotated_image, new_rect.topleft)
+
+
+
+class RocketEnv:
+    """Um foguete e um alvo com API reset()/step(), sem tela nem relógio.
+
+    shaped_reward e normalize_state funcionam como em VectorRocketEnv.
+    step devolve (state, reward, done, info) e não reinicia sozinho.
+    O alvo é sorteado de um numpy Generator próprio criado com seed (int ou
+    SeedSequence), igual ao da linha i de VectorRocketEnv quando
+    seed = SeedSequence(seed_do_vetor).spawn(n)[i].
+    Com action_repeat=k cada step é uma decisão: a ação entra uma vez (os
+    comandos do foguete ficam travados nas flags) e a física roda k frames,
+    somando a recompensa e parando antes se o alvo for atingido.
+    """
+
+    def __init__(self, screen_width=1000, screen_height=750, shaped_reward=True, normalize_state=True,
+                 action_repeat=1, sprites=None, seed=None):
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.shaped_reward = shaped_reward
+        self.normalize_state = normalize_state
+        self.action_repeat = action_repeat
+        # RotationCache compartilhado entre episódios (sem sprites, o do primeiro foguete)
+        self.sprites = sprites
+        self.rng = np.random.default_rng(seed)
+        self.reset()
+
+    def reset(self):
+        self.rocket = Rocket(self.screen_width // 2 - 25, self.screen_height - 47, 30, 47, self.sprites)
+        self.sprites = self.rocket.sprites
+        target_x = int(self.rng.integers(30, self.screen_width - 30, endpoint=True))
+        target_y = int(self.rng.integers(30, self.screen_height - 30, endpoint=True))
+        self.target = Target(target_x, target_y, 10, 10)
+        return self.get_state()
+
+    def step(self, action):
+        self.rocket.handle_input(action)
+        reward = 0
+        for frame in range(self.action_repeat):
+            frame_reward, done, distance = self.advance()
+            reward += frame_reward
+            if done:
+                break
+        return self.get_state(), reward, done, {"distance": distance, "frames": frame + 1}
+
+    def advance(self):
+        """Um frame de física; devolve (recompensa, done, distância)."""
+        distance_to_target = self.target.calculate_distance_to_rocket(self.rocket.rocket_rect)
+        reward = (2000 - distance_to_target) / 100
+        self.rocket.update(self.screen_width, self.screen_height)
+
+        new_distance_to_target = self.target.calculate_distance_to_rocket(self.rocket.rocket_rect)
+        done = new_distance_to_target == 0
+        if self.shaped_reward:
+            if new_distance_to_target > distance_to_target:
+                reward -= 1
+            else:
+                reward += (distance_to_target - new_distance_to_target) / 100
+            if done:
+                reward += 100
+            reward = max(reward, -10)
+        return reward, done, new_distance_to_target
+
+    def get_state(self):
+        rocket_distance_to_target = self.target.calculate_distance_to_rocket(self.rocket.rocket_rect)
+        if self.normalize_state:
+            return np.array(
+                [
+                    rocket_distance_to_target / 2000,
+                    self.rocket.noise_angle / 35,
+                    self.rocket.x / self.screen_width,
+                    self.rocket.y / self.screen_height,
+                    int(self.rocket.thrust),
+                    int(self.rocket.start_deceleration),
+                    int(self.rocket.started_thrust_on_down)
+                ])
+        return np.array(
+            [
+                rocket_distance_to_target,
+                self.rocket.noise_angle,
+                self.rocket.x,
+                self.rocket.y,
+                self.rocket.thrust,
+                self.rocket.start_deceleration,
+                self.rocket.started_thrust_on_down
+            ])
+
+
+class VectorRocketEnv:
+    """N pares foguete/alvo simulados de uma vez com arrays NumPy.
+
+    Mesma dinâmica de Rocket.update: cada flag booleana de Rocket vira uma
+    máscara e cada handle_* vira uma atualização mascarada, na mesma ordem.
+    Com shaped_reward/normalize_state (padrão) a recompensa e o estado seguem
+    o rocket-game-fit-graph.py; desligados, seguem o rocket-game-fit.py.
+    action_repeat funciona como em RocketEnv, por ambiente. Cada ambiente tem
+    seu próprio Generator (filhos de seed), então os alvos não dependem de n.
+    """
+
+    DEFAULT_SPEED = 1
+    SPEED_UP = 1.02
+    GRAVITY_DOWN = 1.05
+    MAX_SPEED = 5
+    GRAVITY_DESACELARATION = 0.965
+    ANGLE_LIMIT = 35
+
+    def __init__(self, n, screen_width=1000, screen_height=750, rocket_width=30, rocket_height=47,
+                 target_size=10, shaped_reward=True, normalize_state=True, seed=None, action_repeat=1):
+        self.n = n
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.rocket_width = rocket_width
+        self.rocket_height = rocket_height
+        self.target_size = target_size
+        self.shaped_reward = shaped_reward
+        self.normalize_state = normalize_state
+        self.action_repeat = action_repeat
+        if not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+        self.rngs = [np.random.default_rng(child) for child in seed.spawn(n)]
+
+        self.x = np.zeros(n)
+        self.y = np.zeros(n)
+        self.speed = np.zeros(n)
+        self.noise_angle = np.zeros(n)
+        self.thrust = np.zeros(n, dtype=bool)
+        self.move_left = np.zeros(n, dtype=bool)
+        self.move_right = np.zeros(n, dtype=bool)
+        self.started_thrust_on_down = np.zeros(n, dtype=bool)
+        self.win_gravity_down = np.zeros(n, dtype=bool)
+        self.request_deceleration = np.zeros(n, dtype=bool)
+        self.start_deceleration = np.zeros(n, dtype=bool)
+        self.started_thrust = np.zeros(n, dtype=bool)
+        self.target_x = np.zeros(n, dtype=np.int64)
+        self.target_y = np.zeros(n, dtype=np.int64)
+        self.reset()
+
+    def reset(self, mask=None):
+        if mask is None:
+            mask = np.ones(self.n, dtype=bool)
+        self.x[mask] = self.screen_width // 2 - 25
+        self.y[mask] = self.screen_height - self.rocket_height
+        self.speed[mask] = 0.7
+        self.noise_angle[mask] = 0
+        for flags in (self.thrust, self.move_left, self.move_right, self.started_thrust_on_down,
+                      self.win_gravity_down, self.request_deceleration, self.start_deceleration,
+                      self.started_thrust):
+            flags[mask] = False
+        # Um sorteio por ambiente reiniciado, na mesma ordem do RocketEnv (x e depois y)
+        for i in np.flatnonzero(mask):
+            self.target_x[i] = self.rngs[i].integers(30, self.screen_width - 30, endpoint=True)
+            self.target_y[i] = self.rngs[i].integers(30, self.screen_height - 30, endpoint=True)
+        return self.get_state()
+
+    def handle_input(self, actions):
+        toggle = actions == 0
+        left = actions == 1
+        right = actions == 2
+        self.thrust ^= toggle
+        self.move_left = (self.move_left & ~toggle & ~right) | left
+        self.move_right = (self.move_right & ~toggle & ~left) | right
+
+    def update(self):
+        ground = self.screen_height - self.rocket_height
+        x, y, speed, angle = self.x, self.y, self.speed, self.noise_angle
+
+        # reset_speed_on_ground
+        on_ground = y == ground
+        speed = np.where(on_ground, self.DEFAULT_SPEED, speed)
+        self.started_thrust_on_down &= ~on_ground
+        self.win_gravity_down &= ~on_ground
+        self.request_deceleration &= ~on_ground
+
+        # handle_deceleration
+        slowing = self.request_deceleration & (speed > self.DEFAULT_SPEED)
+        stopped = self.request_deceleration & ~slowing
+        speed = np.where(slowing, speed * self.GRAVITY_DESACELARATION, speed)
+        y = np.where(slowing, y - speed, y)
+        self.request_deceleration &= ~stopped
+        self.start_deceleration |= stopped
+
+        # handle_gravity_down
+        airborne = (y < ground) & ~self.thrust & ~self.started_thrust_on_down & ~self.request_deceleration
+        self.request_deceleration |= airborne & ~self.start_deceleration
+        falling = airborne & self.start_deceleration
+        self.win_gravity_down &= ~falling
+        self.started_thrust &= ~falling
+        y = np.where(falling, y + speed, y)
+        speed = np.where(falling & (speed < self.MAX_SPEED), speed * self.GRAVITY_DOWN, speed)
+
+        # handle_thrust_on_down
+        slowing = self.started_thrust_on_down & (speed > self.DEFAULT_SPEED)
+        stopped = self.started_thrust_on_down & ~slowing
+        speed = np.where(slowing, speed * self.GRAVITY_DESACELARATION, speed)
+        y = np.where(slowing, y + speed, y)
+        self.started_thrust_on_down &= ~stopped
+        self.win_gravity_down |= stopped
+
+        # handle_thrust
+        thrusting = self.thrust & ~self.started_thrust_on_down
+        first_thrust = thrusting & ~self.win_gravity_down
+        self.request_deceleration &= ~first_thrust
+        self.start_deceleration &= ~first_thrust
+        self.started_thrust_on_down |= first_thrust
+        self.started_thrust |= thrusting
+        y = np.where(thrusting, y - speed, y)
+        speed = np.where(thrusting & (speed < self.MAX_SPEED), speed * self.SPEED_UP, speed)
+
+        # handle_horizontal_movement
+        angle = np.where(self.move_left, np.maximum(angle - 0.3, -self.ANGLE_LIMIT), angle)
+        angle = np.where(self.move_right & ~self.move_left, np.minimum(angle + 0.3, self.ANGLE_LIMIT), angle)
+        x = x + angle / self.MAX_SPEED
+        idle = ~self.move_left & ~self.move_right
+        angle = np.where(idle & (angle > 0), np.maximum(angle - 0.2, 0), angle)
+        angle = np.where(idle & (angle < 0), np.minimum(angle + 0.2, 0), angle)
+
+        # handle_boundary_conditions
+        self.x = np.clip(x, 0, self.screen_width - self.rocket_width)
+        self.y = np.clip(y, 0, ground)
+        self.speed = speed
+        self.noise_angle = angle
+
+    def distance_to_target(self):
+        # Rect arredonda o centro do foguete para inteiro, como em rocket_rect.center
+        rocket_cx = np.floor(self.x + self.rocket_width // 2 + 0.5)
+        rocket_cy = np.floor(self.y + self.rocket_height // 2 + 0.5)
+        target_cx = self.target_x + self.target_size // 2
+        target_cy = self.target_y + self.target_size // 2
+        return np.abs(target_cx - rocket_cx) + np.abs(target_cy - rocket_cy)
+
+    def get_state(self):
+        distance = self.distance_to_target()
+        if self.normalize_state:
+            columns = [distance / 2000, self.noise_angle / 35, self.x / self.screen_width,
+                       self.y / self.screen_height]
+        else:
+            columns = [distance, self.noise_angle, self.x, self.y]
+        columns += [self.thrust, self.start_deceleration, self.started_thrust_on_down]
+        return np.stack(columns, axis=1).astype(np.float32)
+
+    def step(self, actions):
+        """Avança todos os ambientes um passo.
+
+        Devolve (next_states, rewards, dones); next_states é o estado antes do
+        reset, como o trainer guarda na memória. Os ambientes com done são
+        reiniciados em seguida. Com action_repeat, um ambiente que termina no
+        meio da repetição para de somar recompensa e guarda o estado daquele frame.
+        """
+        self.handle_input(np.asarray(actions))
+        rewards = np.zeros(self.n)
+        dones = np.zeros(self.n, dtype=bool)
+        next_states = None
+        for frame in range(self.action_repeat):
+            frame_rewards, frame_dones = self.advance()
+            rewards += np.where(dones, 0, frame_rewards)
+            finished = frame_dones & ~dones
+            dones |= frame_dones
+            if frame < self.action_repeat - 1 and finished.any():
+                frame_states = self.get_state()
+                next_states = frame_states if next_states is None else np.where(finished[:, None], frame_states, next_states)
+        final_states = self.get_state()
+        next_states = final_states if next_states is None else np.where(dones[:, None], next_states, final_states)
+        if dones.any():
+            self.reset(dones)
+        return next_states, rewards, dones
+
+    def advance(self):
+        distance = self.distance_to_target()
+        rewards = (2000 - distance) / 100
+        self.update()
+        new_distance = self.distance_to_target()
+        dones = new_distance == 0
+        if self.shaped_reward:
+            rewards = np.where(new_distance > distance, rewards - 1, rewards + (distance - new_distance) / 100)
+            rewards = np.maximum(rewards + 100 * dones, -10)
+        return rewards, dones
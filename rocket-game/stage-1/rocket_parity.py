@@ -0,0 +1,78 @@
+"""Conferências de paridade do VectorRocketEnv com o Rocket/RocketEnv escalar.
+
+Usadas pelos testes (tests/test_vector_rocket.py, N pequeno) e pelo
+benchmarks/bench_vector_rocket.py (N maior, antes de medir). Cada função
+levanta AssertionError com (passo, ambiente) na primeira divergência e
+devolve quantos passos comparou.
+"""
+import numpy as np
+
+from rocket_env import Rocket, RocketEnv, Target, VectorRocketEnv
+
+SCREEN_WIDTH, SCREEN_HEIGHT = 1000, 750
+FLAGS = ("thrust", "move_left", "move_right", "started_thrust_on_down", "win_gravity_down",
+         "request_deceleration", "start_deceleration", "started_thrust")
+
+
+def scalar_rockets(env):
+    rockets, targets = [], []
+    for i in range(env.n):
+        rockets.append(Rocket(SCREEN_WIDTH // 2 - 25, SCREEN_HEIGHT - 47, 30, 47))
+        targets.append(Target(int(env.target_x[i]), int(env.target_y[i]), 10, 10))
+    return rockets, targets
+
+
+def sticky_actions(rng, n):
+    # ações "grudentas" (3 não mexe em nada) para o foguete de fato sair do chão
+    return np.where(rng.random(n) < 0.1, rng.integers(0, 3, size=n), 3)
+
+
+def check_parity(n=32, steps=3000, seed=0):
+    """Roda foguetes escalares e o VectorRocketEnv com as mesmas ações e compara tudo."""
+    env = VectorRocketEnv(n, seed=seed)
+    rockets, targets = scalar_rockets(env)
+    rng = np.random.default_rng(seed)
+    for step in range(steps):
+        actions = sticky_actions(rng, n)
+        env.handle_input(actions)
+        env.update()
+        for i, (rocket, target) in enumerate(zip(rockets, targets)):
+            rocket.handle_input(actions[i])
+            rocket.update(SCREEN_WIDTH, SCREEN_HEIGHT)
+            assert rocket.x == env.x[i] and rocket.y == env.y[i], (step, i)
+            assert rocket.speed == env.speed[i] and rocket.noise_angle == env.noise_angle[i], (step, i)
+            for flag in FLAGS:
+                assert getattr(rocket, flag) == getattr(env, flag)[i], (step, i, flag)
+            distance = target.calculate_distance_to_rocket(rocket.rocket_rect)
+            assert distance == env.distance_to_target()[i], (step, i)
+    return n * steps
+
+
+def check_target_seeds(n=32, resets=50, seed=0):
+    """Cada ambiente do vetor sorteia os mesmos alvos que um RocketEnv com a seed filha."""
+    env = VectorRocketEnv(n, seed=seed)
+    scalars = [RocketEnv(seed=child) for child in np.random.SeedSequence(seed).spawn(n)]
+    for reset in range(resets):
+        for i, scalar in enumerate(scalars):
+            assert (scalar.target.rect.x, scalar.target.rect.y) == (env.target_x[i], env.target_y[i]), (reset, i)
+            scalar.reset()
+        env.reset()
+    return n * resets
+
+
+def check_step_parity(n=8, steps=300, seed=0, action_repeat=1):
+    """step() do VectorRocketEnv contra n RocketEnv com as seeds filhas: estado, recompensa e done."""
+    env = VectorRocketEnv(n, seed=seed, action_repeat=action_repeat)
+    scalars = [RocketEnv(seed=child, action_repeat=action_repeat) for child in np.random.SeedSequence(seed).spawn(n)]
+    rng = np.random.default_rng(seed)
+    for step in range(steps):
+        actions = sticky_actions(rng, n)
+        next_states, rewards, dones = env.step(actions)
+        for i, scalar in enumerate(scalars):
+            state, reward, done, _ = scalar.step(actions[i])
+            np.testing.assert_allclose(next_states[i], state, rtol=1e-6, err_msg=str((step, i)))
+            assert np.isclose(reward, rewards[i]), (step, i)
+            assert done == dones[i], (step, i)
+            if done:
+                scalar.reset()
+    return n * steps
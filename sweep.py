@@ -0,0 +1,145 @@
+"""Varredura de hiperparâmetros do jump_train.py em paralelo, com successive halving.
+
+A especificação é um JSON com os valores de cada hiperparâmetro (grid), os
+que ficam fixos e, opcionalmente, quantas combinações sortear (random):
+
+    {"grid": {"gamma": [0.7, 0.85], "hidden_layers": [[16, 32], [32, 64]]},
+     "fixed": {"features": 6, "lanes": 8}, "random": 8}
+
+Todas as combinações treinam min_steps passos num Pool de processos (no
+máximo um por núcleo); a melhor 1/eta segue para a próxima rodada com eta
+vezes mais passos, até max_steps. Cada rodada treina do zero com o novo
+orçamento. Os modelos vão para output_dir com nome gerado no padrão de
+models-ok e a tabela de resultados sai em CSV e JSON.
+
+O ranking só é justo e reproduzível porque train() fixa a seed do Keras
+(set_random_seed) a cada chamada: os workers do Pool são reaproveitados
+entre configurações e rodadas, e sem isso os pesos iniciais de cada treino
+dependeriam de quais treinos aquele processo já rodou antes.
+
+    python sweep.py --spec sweep.json --min-steps 2000 --max-steps 16000 --eta 2
+"""
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import time
+
+import numpy as np
+
+from tournament import save_leaderboard
+
+ROOT = os.path.abspath(os.path.dirname(__file__))
+
+# O que os nomes de models-ok mostram que foi variado à mão
+DEFAULT_SPEC = {
+    "grid": {
+        "gamma": [0.7, 0.8, 0.85, 0.9, 0.95],
+        "memory_size": [500, 1000, 1500, 2000],
+        "batch_size": [32, 64],
+        "hidden_layers": [[16, 32], [16, 64], [32, 64], [32, 64, 128]],
+    },
+    "fixed": {"features": 6, "lanes": 8},
+    "random": 16,
+}
+
+
+def expand_spec(spec, seed=0):
+    """Lista de configurações: o produto do grid inteiro ou `random` combinações sorteadas dele."""
+    names = list(spec["grid"])
+    combinations = list(itertools.product(*(spec["grid"][name] for name in names)))
+    if spec.get("random"):
+        rng = np.random.default_rng(seed)
+        picked = rng.choice(len(combinations), size=min(spec["random"], len(combinations)), replace=False)
+        combinations = [combinations[i] for i in sorted(picked)]
+    return [dict(spec.get("fixed", {}), **dict(zip(names, values))) for values in combinations]
+
+
+def init_worker(threads):
+    # Sem isso cada processo abre um pool de threads do tamanho da máquina
+    import tensorflow as tf
+    tf.config.threading.set_intra_op_parallelism_threads(threads)
+    tf.config.threading.set_inter_op_parallelism_threads(threads)
+
+
+def run_config(task):
+    # TensorFlow só é importado nos workers
+    from jump_train import model_name, train
+
+    run, config, steps, seed, output_dir = task
+    config = dict(config)
+    if "hidden_layers" in config:
+        config["hidden_layers"] = tuple(config["hidden_layers"])
+    defaults = {"gamma": 0.7, "memory_size": 2000, "batch_size": 64, "hidden_layers": (32, 64)}
+    naming = {key: config.get(key, value) for key, value in defaults.items()}
+    name = f"{model_name(**naming)}--sweep{run:03d}"
+    result = train(steps=steps, seed=seed, output_dir=output_dir, name=name, verbose=False, **config)
+    row = {"run": run, "steps": steps}
+    row.update({key: json.dumps(value) if isinstance(value, (list, tuple)) else value for key, value in config.items()})
+    row.update({key: value for key, value in result.items() if key != "history"})
+    return row
+
+
+def rank_key(row):
+    # Pesa o modelo salvo (fim do treino); empate vai para o melhor ponto e depois para o mais rápido
+    return (row["hit_rate"], row["best_hit_rate"], -(row["seconds_to_target"] or float("inf")))
+
+
+def successive_halving(configs, min_steps, max_steps, eta=2, seed=0, output_dir=None, processes=None):
+    processes = processes or min(len(configs), multiprocessing.cpu_count())
+    threads = max(1, multiprocessing.cpu_count() // processes)
+    survivors = list(enumerate(configs))
+    steps = min_steps
+    rows = []
+    # spawn: o TensorFlow não gosta de fork
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(processes, initializer=init_worker, initargs=(threads,)) as pool:
+        for rung in itertools.count():
+            start = time.perf_counter()
+            tasks = [(run, config, steps, seed, output_dir) for run, config in survivors]
+            results = sorted(pool.imap_unordered(run_config, tasks), key=rank_key, reverse=True)
+            for row in results:
+                row["rung"] = rung
+            rows.extend(results)
+            print(f"rodada {rung}: {len(tasks)} configurações x {steps} passos em {time.perf_counter() - start:.1f}s, "
+                  f"melhor {results[0]['model']} com {results[0]['hit_rate']:.2%} de acertos")
+            if steps >= max_steps or len(results) == 1:
+                break
+            keep = max(1, len(results) // eta)
+            survivors = [(row["run"], configs[row["run"]]) for row in results[:keep]]
+            steps = min(steps * eta, max_steps)
+    # Tabela final: cada configuração aparece uma vez, com a última rodada que ela alcançou
+    last = {}
+    for row in rows:
+        last[row["run"]] = row
+    return sorted(last.values(), key=lambda row: (row["rung"],) + rank_key(row), reverse=True), rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--spec", default=None, help="JSON com grid, fixed e random (padrão: DEFAULT_SPEC)")
+    parser.add_argument("--min-steps", type=int, default=2000)
+    parser.add_argument("--max-steps", type=int, default=16000)
+    parser.add_argument("--eta", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--output-dir", default=os.path.join(ROOT, "models-trained", "sweep"))
+    args = parser.parse_args()
+
+    spec = DEFAULT_SPEC
+    if args.spec:
+        with open(args.spec) as f:
+            spec = json.load(f)
+    configs = expand_spec(spec, args.seed)
+    start = time.perf_counter()
+    table, rows = successive_halving(configs, args.min_steps, args.max_steps, args.eta, args.seed,
+                                     args.output_dir, args.processes)
+    seconds = time.perf_counter() - start
+    save_leaderboard(table, os.path.join(args.output_dir, "sweep-results"))
+    save_leaderboard(rows, os.path.join(args.output_dir, "sweep-rungs"))
+    total_frames = sum(row["frames"] for row in rows)
+    print(f"{len(configs)} configurações, {len(rows)} treinos em {seconds:.1f}s ({total_frames / seconds:.0f} frames/s no total)")
+    for position, row in enumerate(table[:10], 1):
+        print(f"{position:2d}. {row['model']:60s} rodada {row['rung']}  acertos {row['hit_rate'] * 100:6.2f}%  "
+              f"(melhor {row['best_hit_rate'] * 100:6.2f}%)")
@@ -0,0 +1,64 @@
+"""Gravação em background dos checkpoints: rotação por prefixo e falhas de escrita."""
+import errno
+import os
+import sys
+import time
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "rocket-game", "stage-1"))
+
+pytest.importorskip("tensorflow")
+
+from checkpoint import CheckpointWriter
+from dqn_agent import DQNAgent
+from metrics import MetricsLogger
+
+
+@pytest.fixture(scope="module")
+def agent():
+    return DQNAgent(hidden_layers=(8,), memory_size=100, seed=0)
+
+
+def test_prefixes_do_not_share_files(tmp_path, agent):
+    fit = CheckpointWriter(tmp_path, "model-fit", keep=1)
+    graph = CheckpointWriter(tmp_path, "model-fit-graph", keep=1)
+    graph.save(agent, 1)
+    graph.close()
+    fit.save(agent, 2)
+    fit.close()
+    assert [os.path.basename(path) for path in fit.checkpoints()] == ["model-fit-000000002.npz"]
+    assert [os.path.basename(path) for path in graph.checkpoints()] == ["model-fit-graph-000000001.npz"]
+
+
+def test_failed_write_is_logged_and_does_not_hang(tmp_path, agent, monkeypatch):
+    metrics = MetricsLogger(str(tmp_path / "metrics.jsonl"))
+    writer = CheckpointWriter(tmp_path, "model", metrics=metrics)
+
+    def full_disk():
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    monkeypatch.setattr(agent.memory, "flush", full_disk)
+    writer.save(agent, 1)
+    deadline = time.monotonic() + 10
+    while not writer.errors and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert writer.errors == [(1, "OSError: [Errno 28] No space left on device")]
+    assert not list(tmp_path.glob("*.npz*"))
+
+    # A thread continua viva e a escrita seguinte funciona normalmente
+    monkeypatch.undo()
+    writer.save(agent, 2)
+    writer.close()
+    metrics.close()
+    assert [os.path.basename(path) for path in writer.checkpoints()] == ["model-000000002.npz"]
+    assert "checkpoint_error" in (tmp_path / "metrics.jsonl").read_text()
+
+
+def test_close_returns_when_thread_is_dead(tmp_path):
+    writer = CheckpointWriter(tmp_path, "model")
+    writer.pending.put(None)
+    writer.thread.join()
+    writer.pending.put((1, {}, lambda: None))
+    writer.close()
@@ -0,0 +1,16 @@
+"""Paridade do JumpEnvBatch com JumpEnv: a mesma seed gera a mesma partida, bit a bit."""
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from jump_parity import check_parity
+
+
+@pytest.mark.parametrize("action_repeat", [1, 3])
+@pytest.mark.parametrize("with_coins", [False, True])
+def test_batch_matches_scalar_envs(with_coins, action_repeat):
+    check_parity(n=4, steps=600, with_coins=with_coins, action_repeat=action_repeat)
@@ -0,0 +1,20 @@
+"""Paridade do NumpyModel com o Keras nos .h5 versionados no repo."""
+import glob
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from policy import check_numpy_parity
+
+MODEL_PATHS = sorted(glob.glob(os.path.join(ROOT, "*.h5")) + glob.glob(os.path.join(ROOT, "models-ok", "*.h5"))
+                     + glob.glob(os.path.join(ROOT, "rocket-game", "stage-1", "*.h5")))
+
+
+@pytest.mark.parametrize("model_path", MODEL_PATHS, ids=lambda path: os.path.relpath(path, ROOT))
+def test_numpy_model_matches_keras(model_path):
+    pytest.importorskip("tensorflow")
+    check_numpy_parity([model_path], samples=200)
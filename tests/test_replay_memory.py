@@ -0,0 +1,104 @@
+"""SumTree e PrioritizedReplayBuffer: busca na soma acumulada, amostragem proporcional e persistência."""
+import os
+import sys
+
+import numpy as np
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "rocket-game", "stage-1"))
+
+from replay_memory import PrioritizedReplayBuffer, SumTree
+
+
+def assert_consistent(tree):
+    # Cada nó interno é a soma dos dois filhos
+    nodes = np.arange(1, tree.capacity)
+    np.testing.assert_allclose(tree.tree[nodes], tree.tree[2 * nodes] + tree.tree[2 * nodes + 1])
+
+
+def filled_buffer(priorities, alpha=1.0, beta=0.5, path=None):
+    size = len(priorities)
+    memory = PrioritizedReplayBuffer(size, 2, alpha=alpha, beta=beta, beta_increment=0.0, epsilon=0.0, path=path,
+                                     rng=np.random.default_rng(0))
+    memory.extend(np.zeros((size, 2)), np.zeros(size, dtype=np.int64), np.zeros(size), np.zeros((size, 2)),
+                  np.zeros(size))
+    memory.update_priorities(np.arange(size), np.asarray(priorities, dtype=np.float64))
+    return memory
+
+
+def test_find_boundaries_skip_zero_leaves():
+    tree = SumTree(4)
+    tree.update([0, 1, 2, 3], [1.0, 0.0, 2.0, 3.0])
+    assert tree.total() == 6.0
+    # [0, 1) -> 0; a folha 1 tem prioridade zero e nunca é escolhida; [1, 3) -> 2; [3, 6) -> 3
+    assert tree.find([0.0, 0.999, 1.0, 2.999, 3.0, 5.999]).tolist() == [0, 0, 2, 2, 3, 3]
+
+    tree.update([0], [0.0])
+    assert tree.find([0.0]).tolist() == [2]
+
+
+def test_find_matches_cumulative_sum():
+    rng = np.random.default_rng(0)
+    tree = SumTree(37)
+    priorities = rng.random(37) * (rng.random(37) < 0.7)
+    tree.update(np.arange(37), priorities)
+    values = rng.random(10_000) * tree.total()
+    expected = np.searchsorted(np.cumsum(priorities), values, side="right")
+    np.testing.assert_array_equal(tree.find(values), expected)
+    assert (priorities[tree.find(values)] > 0).all()
+
+
+def test_update_with_duplicate_indices_keeps_tree_consistent():
+    tree = SumTree(8)
+    tree.update(np.arange(8), np.ones(8))
+    # O mesmo índice pode aparecer duas vezes num batch: vale a última prioridade
+    tree.update([3, 5, 3, 5, 3], [10.0, 2.0, 4.0, 7.0, 0.5])
+    assert tree.get([3, 5]).tolist() == [0.5, 7.0]
+    assert tree.total() == pytest.approx(6 + 0.5 + 7.0)
+    assert_consistent(tree)
+
+
+def test_sampling_frequency_is_proportional_to_priority():
+    # 6 transições numa árvore de 8 folhas: as 2 folhas vazias não podem ser sorteadas
+    priorities = np.array([1.0, 2.0, 3.0, 0.5, 0.0, 4.0])
+    memory = filled_buffer(priorities)
+    counts = np.zeros(len(priorities))
+    for _ in range(400):
+        indices, _ = memory.sample_prioritized(64)
+        counts += np.bincount(indices, minlength=len(priorities))
+    np.testing.assert_allclose(counts / counts.sum(), priorities / priorities.sum(), atol=0.005)
+    assert counts[4] == 0
+
+
+def test_importance_sampling_weights():
+    priorities = np.array([1.0, 2.0, 4.0, 8.0])
+    memory = filled_buffer(priorities, alpha=0.5, beta=0.5)
+    indices, weights = memory.sample_prioritized(256)
+    probabilities = priorities[indices] ** 0.5 / (priorities ** 0.5).sum()
+    expected = (len(priorities) * probabilities) ** -0.5
+    np.testing.assert_allclose(weights, expected / expected.max(), rtol=1e-6)
+    assert weights.max() == 1.0
+    # O peso máximo é o da transição menos provável do batch
+    assert weights[np.argmin(probabilities)] == 1.0
+
+
+def test_reopen_persisted_tree_and_per_state(tmp_path):
+    path = str(tmp_path / "replay")
+    memory = PrioritizedReplayBuffer(6, 2, beta=0.4, beta_increment=0.01, path=path, rng=np.random.default_rng(0))
+    memory.extend(np.ones((6, 2)), np.arange(6) % 3, np.arange(6), np.ones((6, 2)), np.zeros(6))
+    memory.update_priorities(np.array([0, 2, 4]), np.array([3.0, 0.1, 5.0]))
+    memory.sample_prioritized(8)
+    memory.flush()
+    tree, max_priority, beta = memory.tree.tree.copy(), memory.max_priority, memory.beta
+    del memory
+
+    reopened = PrioritizedReplayBuffer(6, 2, beta=0.4, beta_increment=0.01, path=path, rng=np.random.default_rng(1))
+    assert len(reopened) == 6
+    np.testing.assert_array_equal(reopened.tree.tree, tree)
+    assert (reopened.max_priority, reopened.beta) == (max_priority, beta)
+    assert beta == pytest.approx(0.41)
+    # Transições novas continuam entrando com a maior prioridade vista antes de reabrir
+    reopened.append(np.ones(2), 0, 0.0, np.ones(2), 0.0)
+    assert reopened.tree.get([0])[0] == pytest.approx(max_priority ** reopened.alpha)
+    assert_consistent(reopened.tree)
@@ -0,0 +1,23 @@
+"""Paridade do VectorRocketEnv com o Rocket/RocketEnv escalar (física, alvos sorteados e action_repeat)."""
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "rocket-game", "stage-1"))
+
+from rocket_parity import check_parity, check_step_parity, check_target_seeds
+
+
+def test_update_matches_scalar_rocket():
+    check_parity(n=4, steps=400)
+
+
+def test_targets_match_rocket_env_seeds():
+    check_target_seeds(n=4, resets=10)
+
+
+@pytest.mark.parametrize("action_repeat", [1, 4])
+def test_step_matches_rocket_env(action_repeat):
+    check_step_parity(n=4, steps=100, action_repeat=action_repeat)
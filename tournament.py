@@ -0,0 +1,104 @@
+"""Avaliação headless de todos os modelos de models-ok nas mesmas sequências sorteadas.
+
+Cada modelo joga os mesmos episódios (mesma seed => mesmos obstáculos e moedas)
+e os modelos rodam em paralelo, um por processo. O resultado sai como
+leaderboard em CSV e JSON.
+
+    python tournament.py --episodes 20 --frames 2000
+"""
+import argparse
+import csv
+import glob
+import json
+import multiprocessing
+import os
+import re
+import time
+
+from jump_env import JumpEnv
+from numpy_model import load_dense_layers
+from policy import load_policy
+
+ROOT = os.path.abspath(os.path.dirname(__file__))
+
+
+def describe_model(model_path):
+    name = os.path.basename(model_path)
+    layers = load_dense_layers(model_path)
+    gamma = re.search(r"gm--([\d.]+?)-", name)
+    memory = re.search(r"mem--(\d+)", name)
+    batch_size = re.search(r"bs--(\d+)", name)
+    return {
+        "model": name,
+        "gamma": float(gamma.group(1)) if gamma else None,
+        "memory": int(memory.group(1)) if memory else None,
+        "batch_size": int(batch_size.group(1)) if batch_size else None,
+        "layers": "-".join(str(kernel.shape[1]) for kernel, _, _ in layers[:-1]),
+        "features": layers[0][0].shape[0],
+    }
+
+
+def evaluate_model(task):
+    model_path, episodes, frames, seed, backend = task
+    policy = load_policy(model_path, backend)
+    env = JumpEnv(with_coins=policy.state_size == 6)
+
+    score = errors = coins = 0
+    start = time.perf_counter()
+    for episode in range(episodes):
+        state = env.reset(seed=seed + episode)
+        for _ in range(frames):
+            state, _, _, _ = env.step(policy.act(state))
+        score += env.score
+        errors += env.errors
+        coins += env.coins
+    elapsed = time.perf_counter() - start
+
+    row = describe_model(model_path)
+    stats = policy.latency.percentiles()
+    row.update({
+        "hit_rate": score / (score + errors) if score + errors else 0.0,
+        "score": score,
+        "errors": errors,
+        "coins_per_episode": coins / episodes,
+        "inference_p50_us": stats["p50"],
+        "inference_p99_us": stats["p99"],
+        "frames_per_sec": episodes * frames / elapsed,
+    })
+    return row
+
+
+def run_tournament(model_paths, episodes, frames, seed=0, backend="numpy", processes=None):
+    tasks = [(model_path, episodes, frames, seed, backend) for model_path in model_paths]
+    processes = processes or min(len(tasks), multiprocessing.cpu_count())
+    with multiprocessing.Pool(processes) as pool:
+        rows = pool.map(evaluate_model, tasks)
+    rows.sort(key=lambda row: (row["hit_rate"], row["coins_per_episode"]), reverse=True)
+    return rows
+
+
+def save_leaderboard(rows, output):
+    with open(f"{output}.json", "w") as f:
+        json.dump(rows, f, indent=2)
+    with open(f"{output}.csv", "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--models", nargs="*", default=sorted(glob.glob(os.path.join(ROOT, "models-ok", "*.h5"))))
+    parser.add_argument("--episodes", type=int, default=10)
+    parser.add_argument("--frames", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--backend", default="numpy", choices=["numpy", "keras"])
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--output", default="leaderboard")
+    args = parser.parse_args()
+
+    rows = run_tournament(args.models, args.episodes, args.frames, args.seed, args.backend, args.processes)
+    save_leaderboard(rows, args.output)
+    for position, row in enumerate(rows, 1):
+        print(f"{position:2d}. {row['model']:55s} acertos {row['hit_rate'] * 100:6.2f}%  "
+              f"moedas/ep {row['coins_per_episode']:6.1f}  inferência p50 {row['inference_p50_us']:.0f} us")